@@ -0,0 +1,165 @@
+"""
+Archive module for cold-tier task storage.
+
+Ce module gère le tiers « froid » d'un fichier de tâches : les tâches rarement
+consultées sont déplacées dans un segment d'archive en ajout seul (append-only),
+éventuellement compressé avec gzip, afin que le fichier « chaud » reste petit et
+que les commandes modify/rm/labels n'aient plus à le réécrire.
+
+Fichiers associés à un fichier de tâches <fichier>:
+    - <fichier>.archive     : tâches archivées au format "ID;Description;Labels"
+                              (texte brut ou flux gzip multi-membres)
+    - <fichier>.archive.idx : plus grand ID archivé, lu par la commande add
+                              pour garder des IDs uniques entre les deux tiers
+                              (reconstruit depuis l'archive s'il manque ou s'il
+                              n'est pas plus récent qu'elle)
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import gzip
+import os
+
+import core
+import streaming
+
+# Signature des flux gzip (RFC 1952)
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def archive_path(filename):
+    """
+    Retourne le chemin du segment d'archive associé à un fichier de tâches.
+
+    Example:
+        >>> archive_path("lestaches.txt")
+        'lestaches.txt.archive'
+    """
+    return filename + ".archive"
+
+
+def index_path(filename):
+    """
+    Retourne le chemin du fichier d'index de l'archive (plus grand ID archivé).
+
+    Example:
+        >>> index_path("lestaches.txt")
+        'lestaches.txt.archive.idx'
+    """
+    return filename + ".archive.idx"
+
+
+def is_compressed(path):
+    """
+    Indique si un segment d'archive est compressé avec gzip.
+
+    Args:
+        path (str): Chemin du segment d'archive
+
+    Returns:
+        bool: True si le fichier commence par la signature gzip, False sinon
+              (y compris si le fichier n'existe pas)
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(2) == GZIP_MAGIC
+    except FileNotFoundError:
+        return False
+
+
+def iter_archive(filename):
+    """
+    Parcourt paresseusement les lignes du segment d'archive.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches (tiers chaud)
+
+    Yields:
+        str: Lignes brutes de l'archive, dans l'ordre d'archivage
+
+    Note:
+        - Le fichier n'est ouvert qu'au premier élément demandé
+        - Ne produit rien si aucune archive n'existe
+        - Gère de manière transparente les archives texte et gzip
+    """
+    path = archive_path(filename)
+    if not os.path.exists(path):
+        return
+    opener = gzip.open if is_compressed(path) else open
+    with opener(path, 'rt') as f:
+        for line in f:
+            yield line
+
+
+def write_index(filename, max_id):
+    """
+    Enregistre le plus grand ID archivé (remplacement atomique de l'index).
+    """
+    with streaming.atomic_write(index_path(filename)) as f:
+        f.write(f"{max_id}\n")
+
+
+def read_max_id(filename):
+    """
+    Lit le plus grand ID archivé depuis l'index de l'archive.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches (tiers chaud)
+
+    Returns:
+        int: Plus grand ID présent dans l'archive, 0 si aucune archive
+
+    Note:
+        L'index est écrit après l'archive: s'il manque, s'il est illisible ou
+        s'il n'est pas plus récent que l'archive (interruption entre les deux
+        écritures), l'archive est relue en entier et l'index reconstruit.
+    """
+    try:
+        archive_mtime = os.stat(archive_path(filename)).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+    try:
+        with open(index_path(filename), 'r') as f:
+            if os.fstat(f.fileno()).st_mtime_ns > archive_mtime:
+                return int(f.read())
+    except (FileNotFoundError, ValueError):
+        pass
+
+    # Index absent ou périmé: le plus grand ID est recalculé depuis l'archive
+    max_id = core.max_id(iter_archive(filename))
+    write_index(filename, max_id)
+    return max_id
+
+
+def append_tasks(filename, parsed_tasks, compress=False):
+    """
+    Ajoute des tâches à la fin du segment d'archive et met à jour l'index.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches (tiers chaud)
+        parsed_tasks (list): Tuples (id, description, labels) à archiver
+        compress (bool): Compresse le segment avec gzip s'il est créé
+
+    Note:
+        - L'archive n'est jamais réécrite, seulement complétée
+        - Une archive existante conserve son format (texte ou gzip),
+          l'option compress ne s'applique qu'à la création
+        - Chaque ajout compressé forme un nouveau membre gzip, ce qui reste
+          un flux gzip valide
+    """
+    # Plus grand ID archivé avant l'ajout (l'index est encore à jour)
+    max_id = max([read_max_id(filename)] + [tid for tid, _, _ in parsed_tasks])
+
+    path = archive_path(filename)
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        compress = is_compressed(path)
+
+    opener = gzip.open if compress else open
+    with opener(path, 'at') as f:
+        for tid, desc, labels in parsed_tasks:
+            labels_str = ",".join(labels) if labels else ""
+            f.write(f"{tid};{desc};{labels_str}\n")
+
+    # L'index est écrit après l'archive: il reste ainsi plus récent qu'elle
+    write_index(filename, max_id)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the fast parser against the reference parser.
+
+Mesure, sur un fichier de tâches (généré ou fourni), le temps de:
+    - core.parse_tasks(f.readlines()) contre fastparse.parse_file
+    - core.max_id(f) contre fastparse.max_id (calcul de l'ID de add)
+et vérifie au passage que les résultats sont identiques.
+
+Usage:
+    python3 codes/bench_fastparse.py [--tasks 500000] [--repeat 5] [--file lestaches.txt]
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import core
+import fastparse
+
+
+def generate(path, count):
+    """
+    Écrit un fichier de count tâches au format des commandes (quelques labels).
+    """
+    labels = ["", "urgent", "personnel", "urgent,personnel", "travail"]
+    with open(path, 'w', buffering=1 << 20) as f:
+        for tid in range(1, count + 1):
+            f.write(f"{tid};Tâche numéro {tid};{labels[tid % len(labels)]}\n")
+
+
+def best_time(function, repeat):
+    """
+    Retourne le meilleur temps (en ms) de repeat exécutions et le dernier résultat.
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        result = None
+        start = time.perf_counter()
+        result = function()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def reference_parse(path):
+    with open(path, 'r') as f:
+        return core.parse_tasks(f.readlines())
+
+
+def reference_max_id(path):
+    with open(path, 'r') as f:
+        return core.max_id(f)
+
+
+def fast_max_id(path):
+    with open(path, 'rb') as f:
+        return fastparse.max_id(f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare core.parse_tasks et fastparse")
+    parser.add_argument('--tasks', type=int, default=500000,
+                        help="Nombre de tâches du fichier généré (défaut: 500000)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Nombre de mesures, le meilleur temps est retenu (défaut: 5)")
+    parser.add_argument('--file', help="Fichier de tâches existant à utiliser")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = options.file
+        if path is None:
+            path = os.path.join(directory, "tasks.txt")
+            generate(path, options.tasks)
+        size = os.path.getsize(path)
+        print(f"{path}: {size / (1 << 20):.1f} MiB")
+
+        cases = (
+            ("parse", reference_parse, fastparse.parse_file),
+            ("max_id", reference_max_id, fast_max_id),
+        )
+        for name, reference, fast in cases:
+            reference_ms, expected = best_time(lambda: reference(path), options.repeat)
+            fast_ms, result = best_time(lambda: fast(path), options.repeat)
+            status = "identical" if result == expected else "MISMATCH"
+            print(f"{name:7} core {reference_ms:8.0f} ms   fastparse {fast_ms:8.0f} ms   "
+                  f"x{reference_ms / fast_ms:.2f}   {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,34 +12,67 @@ Chaque fonction correspond à une commande CLI et gère:
 Auteurs: Groupe 4 - Codecamp
 """
 
+import glob
+import heapq
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import archive
 import core
+import extsort
+import fastparse
+import streaming
+import sync
+import transfer
+import watch
+
+# Nombre maximal d'IDs en conflit listés par sync
+MAX_LISTED_CONFLICTS = 20
 
 
-def add(details, filename, tasks, labels=None):
+def add(details, filename, labels=None):
     """
     Commande CLI pour ajouter une nouvelle tâche.
     
     Args:
         details (str): Description de la nouvelle tâche
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
+        filename (str): Chemin vers le fichier de tâches (créé s'il n'existe pas)
         labels (list, optional): Liste des labels à associer à la tâche
         
     Side Effects:
         - Ajoute une ligne au fichier spécifié
         - Affiche un message de confirmation avec l'ID assigné
         
+    Note:
+        Seuls les IDs du fichier sont lus (fastparse.max_id), sans analyser
+        descriptions ni labels.
+        
     Example:
-        >>> add("Faire les courses", "tasks.txt", [], ["urgent", "personnel"])
+        >>> add("Faire les courses", "tasks.txt", ["urgent", "personnel"])
         Successfully added task 1 (Faire les courses) with labels: urgent,personnel
     """
+    try:
+        with open(filename, 'rb') as f:
+            file_max_id = fastparse.max_id(f.read())
+    except FileNotFoundError:
+        file_max_id = 0
+    
     # Utilise la logique métier pour créer la nouvelle tâche
-    task_id, description, task_labels, task_line = core.add(tasks, details, labels)
+    # (l'ID reste unique par rapport aux tâches archivées)
+    task_id, description, task_labels, task_line = core.add(
+        [], details, labels, max(file_max_id, archive.read_max_id(filename)))
     
     # Ajoute la tâche au fichier (mode append)
+    before = sync.snapshot(filename)
     with open(filename, 'a') as f:
         f.write(task_line)
     
+    sync.track(filename, before)
     # Confirmation à l'utilisateur
     if task_labels:
         labels_str = ",".join(task_labels)
@@ -47,7 +80,7 @@ def add(details, filename, tasks, labels=None):
     else:
         print(f"Successfully added task {task_id} ({description})")
 
-def modify(task_id, new_details, filename, tasks, new_labels=None):
+def modify(task_id, new_details, filename, new_labels=None):
     """
     Commande CLI pour modifier une tâche existante.
     
@@ -55,86 +88,107 @@ def modify(task_id, new_details, filename, tasks, new_labels=None):
         task_id (str): ID de la tâche à modifier
         new_details (str): Nouvelle description pour la tâche
         filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         new_labels (list, optional): Nouveaux labels pour la tâche (None = pas de changement)
         
     Side Effects:
-        - Réécrit entièrement le fichier avec les modifications
+        - Réécrit le fichier avec la tâche modifiée
         - Affiche un message de succès ou d'erreur
         
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+        
     Note:
-        Le fichier est entièrement réécrit pour maintenir la cohérence.
+        Le fichier est réécrit en flux, en mémoire constante (voir module streaming);
+        le manifeste d'un fichier synchronisé est corrigé en flux lui aussi
+        (voir sync.track).
         
     Example:
-        >>> modify("1", "Nouvelle description", "tasks.txt", ["1;Ancienne"])
+        >>> modify("1", "Nouvelle description", "tasks.txt")
         Task 1 modified.
     """
-    # Utilise la logique métier pour modifier la tâche
-    found, updated_tasks = core.modify(tasks, task_id, new_details, new_labels)
+    # Réécrit le fichier en ne transformant que la tâche ciblée
+    before = sync.snapshot(filename)
+    changes = {}
+    found = streaming.rewrite(filename, task_id,
+                              lambda task: core.modify_task(task, new_details, new_labels),
+                              changes=changes)
     
     if found:
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, labels in updated_tasks:
-                labels_str = ",".join(labels) if labels else ""
-                f.write(f"{tid};{desc};{labels_str}\n")
+        sync.track(filename, before, changes)
         print(f"Task {task_id} modified.")
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
 
-def rm(task_id, filename, tasks):
+def rm(task_id, filename):
     """
     Commande CLI pour supprimer une tâche.
     
     Args:
         task_id (str): ID de la tâche à supprimer
         filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
         - Réécrit le fichier sans la tâche supprimée
         - Affiche un message de succès ou d'erreur
         
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+        
     Note:
         Les IDs des autres tâches ne sont pas modifiés après suppression.
+        Toutes les lignes portant cet ID sont supprimées, comme core.rm.
         
     Example:
-        >>> rm("1", "tasks.txt", ["1;Tâche à supprimer", "2;Autre tâche"])
+        >>> rm("1", "tasks.txt")
         Task 1 removed.
     """
-    # Utilise la logique métier pour supprimer la tâche
-    found, remaining_tasks = core.rm(tasks, task_id)
+    # Réécrit le fichier sans les lignes de la tâche
+    before = sync.snapshot(filename)
+    changes = {}
+    found = streaming.rewrite(filename, task_id, lambda task: None, all_matches=True,
+                              changes=changes)
     
     if found:
-        # Réécrit le fichier avec les tâches restantes
-        with open(filename, 'w') as f:
-            for tid, desc, labels in remaining_tasks:
-                labels_str = ",".join(labels) if labels else ""
-                f.write(f"{tid};{desc};{labels_str}\n")
+        sync.track(filename, before, changes)
         print(f"Task {task_id} removed.")
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
+
+def load_tasks(filename, include_archive=False):
+    """
+    Lit et analyse toutes les tâches d'un fichier (et de son archive si demandé).
     
-    if found:
-        # Réécrit le fichier avec les tâches restantes
-        with open(filename, 'w') as f:
-            for tid, desc, labels in remaining_tasks:
-                labels_str = ",".join(labels) if labels else ""
-                f.write(f"{tid};{desc};{labels_str}\n")
-        print(f"Task {task_id} removed.")
-    else:
-        # Message d'erreur si la tâche n'existe pas
-        print(f"Error: task id {task_id} not found.")
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        include_archive (bool, optional): Inclut les tâches du segment d'archive
+        
+    Returns:
+        list: Tuples (id, description, labels) dans l'ordre du fichier, puis de l'archive
+        
+    Note:
+        Le fichier est analysé par fastparse (même résultat que core.parse_tasks).
+        Un fichier inexistant est traité comme un fichier vide.
+    """
+    try:
+        parsed_tasks = fastparse.parse_file(filename)
+    except FileNotFoundError:
+        parsed_tasks = []
+    
+    if include_archive:
+        parsed_tasks.extend(core.iter_tasks(archive.iter_archive(filename)))
+    return parsed_tasks
+
 
-def show(tasks, label_filter=None):
+def show(filename, label_filter=None, include_archive=False):
     """
     Commande CLI pour afficher toutes les tâches.
     
     Args:
-        tasks (list): Liste des lignes du fichier de tâches
+        filename (str): Chemin vers le fichier de tâches
         label_filter (str, optional): Filtre pour n'afficher que les tâches avec ce label
+        include_archive (bool, optional): Inclut les tâches du segment d'archive
         
     Side Effects:
         - Affiche un tableau formaté des tâches sur stdout
@@ -142,9 +196,10 @@ def show(tasks, label_filter=None):
         
     Note:
         Délègue l'affichage au module core qui gère le formatage du tableau.
+        L'archive n'est lue que si include_archive est demandé, ligne par ligne.
         
     Example:
-        >>> show(["1;Première tâche;urgent", "2;Seconde tâche;personnel"])
+        >>> show("tasks.txt")
         +-----+---------------+----------+
         | id  | description   | labels   |
         +-----+---------------+----------+
@@ -153,10 +208,208 @@ def show(tasks, label_filter=None):
         +-----+---------------+----------+
     """
     # Délègue l'affichage au module core
-    core.show(tasks, label_filter)
+    core.show_parsed(load_tasks(filename, include_archive), label_filter)
 
 
-def add_label(task_id, label, filename, tasks):
+def show_sorted(filename, sort_key='id', descending=False, max_memory=64 << 20,
+                label_filter=None, include_archive=False):
+    """
+    Commande CLI pour afficher les tâches triées sur une colonne (show --sort).
+    
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        sort_key (str, optional): 'id', 'description' ou 'labels'
+        descending (bool, optional): Tri décroissant
+        max_memory (int, optional): Budget mémoire approximatif en octets
+        label_filter (str, optional): Filtre pour n'afficher que les tâches avec ce label
+        include_archive (bool, optional): Inclut les tâches du segment d'archive
+        
+    Side Effects:
+        - Affiche un tableau formaté des tâches sur stdout
+        
+    Raises:
+        FileNotFoundError: Si le fichier de tâches n'existe pas
+        
+    Note:
+        Le fichier est lu ligne par ligne et trié par tri externe (module extsort):
+        au-delà de max_memory, des runs triés sont écrits dans des fichiers
+        temporaires puis fusionnés. Les largeurs de colonnes sont mesurées pendant
+        la lecture, et le tableau est affiché au fil de la fusion.
+        
+    Example:
+        >>> show_sorted("tasks.txt", "description", descending=True)
+        +-----+----------------+----------+
+        | id  | description    | labels   |
+        +-----+----------------+----------+
+        | 2   | Seconde tâche  | personnel|
+        | 1   | Première tâche | urgent   |
+        +-----+----------------+----------+
+    """
+    widths = {'description': 11, 'labels': 6}
+    
+    def measured(tasks):
+        # Mesure les colonnes et applique le filtre pendant la lecture
+        for task in tasks:
+            if label_filter and label_filter not in task[2]:
+                continue
+            widths['description'] = max(widths['description'], len(task[1]))
+            widths['labels'] = max(widths['labels'], len(",".join(task[2])))
+            yield task
+    
+    with open(filename, 'r') as f, tempfile.TemporaryDirectory() as directory:
+        lines = itertools.chain(f, archive.iter_archive(filename)) if include_archive else f
+        sorted_tasks = extsort.sort_tasks(measured(core.iter_tasks(lines)), sort_key,
+                                          descending, max_memory, directory)
+        
+        # La première tâche n'est produite qu'une fois toute l'entrée lue
+        first = next(sorted_tasks, None)
+        if first is None:
+            if label_filter:
+                print(f"No tasks found with label '{label_filter}'.")
+            else:
+                print("No tasks found.")
+            return
+        
+        core.print_table(itertools.chain([first], sorted_tasks),
+                         widths['description'], widths['labels'])
+
+
+def show_watch(filename, label_filter=None, interval=1.0, events=False, include_archive=False):
+    """
+    Commande CLI pour suivre un fichier de tâches en continu (show --watch).
+    
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        label_filter (str, optional): Filtre pour n'afficher que les tâches avec ce label
+        interval (float, optional): Délai en secondes entre deux vérifications
+        events (bool, optional): Émet des événements JSON au lieu du tableau
+        include_archive (bool, optional): Inclut les tâches du segment d'archive
+        
+    Side Effects:
+        - Affiche le tableau à chaque changement du fichier, ou
+        - En mode événements, écrit une ligne JSON par changement:
+          {"event": "reload"} puis {"event": "add", "id": ..., "description": ..., "labels": [...]}
+        - S'arrête proprement sur Ctrl+C
+        
+    Note:
+        Seules les lignes ajoutées depuis le dernier passage sont lues et analysées.
+        Le fichier n'est relu entièrement que s'il a été réécrit (voir module watch).
+        L'archive n'est modifiée que par la commande archive, qui réécrit aussi le
+        fichier: elle est donc relue au démarrage et à chaque réécriture seulement.
+        
+    Example:
+        >>> show_watch("tasks.txt", events=True)
+        {"event": "reload"}
+        {"event": "add", "id": 1, "description": "Faire les courses", "labels": ["urgent"]}
+    """
+    state = watch.new_state()
+    parsed_tasks = []
+    archived_tasks = None
+    
+    try:
+        while True:
+            reloaded, lines = watch.poll(filename, state)
+            new_tasks = core.parse_tasks(lines)
+            if reloaded:
+                parsed_tasks = []
+            parsed_tasks.extend(new_tasks)
+            
+            if include_archive and (reloaded or archived_tasks is None):
+                archived_tasks = core.parse_tasks(archive.iter_archive(filename))
+                new_tasks = archived_tasks + new_tasks
+            
+            if events:
+                # Une ligne JSON par événement, vidée immédiatement pour les scripts
+                if reloaded:
+                    print(json.dumps({"event": "reload"}))
+                for tid, desc, labels in new_tasks:
+                    if not label_filter or label_filter in labels:
+                        print(json.dumps({"event": "add", "id": tid, "description": desc,
+                                          "labels": labels}, ensure_ascii=False))
+                sys.stdout.flush()
+            elif reloaded or new_tasks:
+                # Efface l'écran avant de réafficher le tableau (terminal uniquement)
+                if sys.stdout.isatty():
+                    print("\033[2J\033[H", end="")
+                core.show_parsed((archived_tasks or []) + parsed_tasks, label_filter)
+                sys.stdout.flush()
+            
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def load_sorted_tasks(filename, label_filter=None, include_archive=False):
+    """
+    Charge, filtre et trie par ID les tâches d'un fichier, annotées de leur source.
+    
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        label_filter (str, optional): Ne garde que les tâches avec ce label
+        include_archive (bool, optional): Inclut les tâches du segment d'archive
+        
+    Returns:
+        list: Tuples (id, description, labels, filename) triés par ID croissant
+        
+    Note:
+        Un fichier inexistant est traité comme un fichier vide.
+    """
+    return sorted(((tid, desc, labels, filename)
+                   for tid, desc, labels in load_tasks(filename, include_archive)
+                   if not label_filter or label_filter in labels),
+                  key=lambda x: x[0])
+
+
+def show_files(pattern, label_filter=None, include_archive=False):
+    """
+    Commande CLI pour afficher les tâches de plusieurs fichiers (--files).
+    
+    Args:
+        pattern (str): Motif glob des fichiers de tâches (ex: 'teams/*.txt')
+        label_filter (str, optional): Filtre pour n'afficher que les tâches avec ce label
+        include_archive (bool, optional): Inclut les tâches archivées de chaque fichier
+        
+    Side Effects:
+        - Affiche un tableau unique avec une colonne indiquant le fichier d'origine
+        - Affiche un message d'erreur si aucun fichier ne correspond au motif
+        
+    Note:
+        Chaque fichier est chargé, filtré et trié dans un pool de processus
+        (l'analyse est du code Python: des threads seraient sérialisés par le
+        GIL), puis les flux triés par ID sont fusionnés (fusion k-voies avec
+        heapq.merge) avant un seul affichage. Avec assez de cœurs, le temps de
+        chargement est donc borné par le fichier le plus lent.
+        À ID égal, l'ordre alphabétique des fichiers est conservé.
+        
+    Example:
+        >>> show_files("teams/*.txt", "urgent")
+        +-----+-------------+--------+----------------+
+        | id  | description | labels | file           |
+        +-----+-------------+--------+----------------+
+        | 1   | Déployer    | urgent | teams/back.txt |
+        | 1   | Maquettes   | urgent | teams/ux.txt   |
+        +-----+-------------+--------+----------------+
+    """
+    filenames = sorted(glob.glob(pattern))
+    if not filenames:
+        print(f"Error: no files match '{pattern}'.")
+        return
+    
+    # Chargement parallèle des fichiers (un seul fichier: pas de processus à lancer)
+    if len(filenames) == 1:
+        streams = [load_sorted_tasks(filenames[0], label_filter, include_archive)]
+    else:
+        with ProcessPoolExecutor(min(len(filenames), os.cpu_count() or 1)) as executor:
+            streams = list(executor.map(load_sorted_tasks, filenames,
+                                        itertools.repeat(label_filter),
+                                        itertools.repeat(include_archive)))
+    
+    # Fusion k-voies des flux déjà triés puis affichage unique
+    merged_tasks = list(heapq.merge(*streams, key=lambda x: x[0]))
+    core.show_parsed(merged_tasks, label_filter, with_source=True)
+
+
+def add_label(task_id, label, filename):
     """
     Commande CLI pour ajouter un label à une tâche.
     
@@ -164,26 +417,27 @@ def add_label(task_id, label, filename, tasks):
         task_id (str): ID de la tâche à modifier
         label (str): Label à ajouter
         filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
         - Réécrit le fichier avec le label ajouté
         - Affiche un message de succès ou d'erreur
+        
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
     """
-    found, updated_tasks = core.add_label(tasks, task_id, label)
+    before = sync.snapshot(filename)
+    changes = {}
+    found = streaming.rewrite(filename, task_id, lambda task: core.add_label_task(task, label),
+                              changes=changes)
     
     if found:
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, labels in updated_tasks:
-                labels_str = ",".join(labels) if labels else ""
-                f.write(f"{tid};{desc};{labels_str}\n")
+        sync.track(filename, before, changes)
         print(f"Label '{label}' added to task {task_id}.")
     else:
         print(f"Error: task id {task_id} not found.")
 
 
-def rm_label(task_id, label, filename, tasks):
+def rm_label(task_id, label, filename):
     """
     Commande CLI pour supprimer un label d'une tâche.
     
@@ -191,29 +445,39 @@ def rm_label(task_id, label, filename, tasks):
         task_id (str): ID de la tâche à modifier
         label (str): Label à supprimer
         filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
         - Réécrit le fichier avec le label supprimé
         - Affiche un message de succès ou d'erreur
+        
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+        
+    Note:
+        Si la tâche n'a pas ce label, le fichier n'est pas réécrit.
     """
-    found, label_found, updated_tasks = core.rm_label(tasks, task_id, label)
+    state = {'found': False}
     
-    if found:
-        if label_found:
-            # Réécrit tout le fichier avec les tâches mises à jour
-            with open(filename, 'w') as f:
-                for tid, desc, labels in updated_tasks:
-                    labels_str = ",".join(labels) if labels else ""
-                    f.write(f"{tid};{desc};{labels_str}\n")
-            print(f"Label '{label}' removed from task {task_id}.")
-        else:
-            print(f"Error: label '{label}' not found in task {task_id}.")
+    def remove(task):
+        state['found'] = True
+        task, label_found = core.rm_label_task(task, label)
+        if not label_found:
+            # Rien à changer: abandonne la réécriture
+            raise streaming.Unchanged()
+        return task
+    
+    before = sync.snapshot(filename)
+    changes = {}
+    if streaming.rewrite(filename, task_id, remove, changes=changes):
+        sync.track(filename, before, changes)
+        print(f"Label '{label}' removed from task {task_id}.")
+    elif state['found']:
+        print(f"Error: label '{label}' not found in task {task_id}.")
     else:
         print(f"Error: task id {task_id} not found.")
 
 
-def set_labels(task_id, labels_str, filename, tasks):
+def set_labels(task_id, labels_str, filename):
     """
     Commande CLI pour remplacer les labels d'une tâche.
     
@@ -221,26 +485,354 @@ def set_labels(task_id, labels_str, filename, tasks):
         task_id (str): ID de la tâche à modifier
         labels_str (str): Nouveaux labels séparés par des virgules
         filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
         - Réécrit le fichier avec les nouveaux labels
         - Affiche un message de succès ou d'erreur
+        
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
     """
     # Parse les labels depuis la chaîne
     new_labels = [label.strip() for label in labels_str.split(",") if label.strip()] if labels_str else []
     
-    found, updated_tasks = core.set_labels(tasks, task_id, new_labels)
+    before = sync.snapshot(filename)
+    changes = {}
+    found = streaming.rewrite(filename, task_id, lambda task: core.set_labels_task(task, new_labels),
+                              changes=changes)
     
     if found:
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, labels in updated_tasks:
-                labels_str = ",".join(labels) if labels else ""
-                f.write(f"{tid};{desc};{labels_str}\n")
+        sync.track(filename, before, changes)
         if new_labels:
             print(f"Labels for task {task_id} set to: {','.join(new_labels)}")
         else:
             print(f"All labels removed from task {task_id}.")
     else:
-        print(f"Error: task id {task_id} not found.")
\ No newline at end of file
+        print(f"Error: task id {task_id} not found.")
+
+
+def archive_tasks(filename, label=None, id_range=None, compress=False):
+    """
+    Commande CLI pour déplacer des tâches vers le segment d'archive.
+    
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        label (str, optional): N'archive que les tâches portant ce label
+        id_range (str, optional): Plage d'IDs à archiver (ex: "1-100")
+        compress (bool, optional): Compresse l'archive avec gzip lors de sa création
+        
+    Side Effects:
+        - Ajoute les tâches sélectionnées à la fin de l'archive
+        - Réécrit le fichier de tâches sans les tâches archivées
+        - Affiche un message de succès ou d'erreur
+        
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+        
+    Note:
+        - Le fichier est lu en flux, comme streaming.rewrite: seules les tâches
+          sélectionnées sont gardées en mémoire, les autres lignes (y compris
+          vides ou invalides) sont recopiées telles quelles
+        - L'archive est écrite avant le remplacement du fichier, lui-même atomique
+          (streaming.atomic_write): une interruption peut dupliquer une tâche
+          entre les deux tiers, mais jamais la perdre ni tronquer le fichier
+        
+    Example:
+        >>> archive_tasks("tasks.txt", label="done")
+        Archived 1 task(s) to tasks.txt.archive.
+    """
+    if label is None and id_range is None:
+        print("Error: archive requires --where-label and/or --ids.")
+        return
+    
+    # Validation de la plage d'IDs
+    bounds = None
+    if id_range is not None:
+        try:
+            bounds = core.parse_id_range(id_range)
+        except ValueError:
+            print(f"Error: invalid id range '{id_range}'.")
+            return
+    
+    archived = []
+    try:
+        with open(filename, 'r', buffering=streaming.BUFFER_SIZE) as src, \
+                streaming.atomic_write(filename) as out:
+            for line in src:
+                task = next(core.iter_tasks([line]), None)
+                if task is not None and core.is_archivable(task, label, bounds):
+                    archived.append(task)
+                else:
+                    out.write(line if line.endswith("\n") else line + "\n")
+            
+            if not archived:
+                raise streaming.Unchanged()
+            # Ajoute d'abord au tiers froid: le fichier n'est remplacé qu'ensuite
+            archive.append_tasks(filename, archived, compress)
+    except streaming.Unchanged:
+        print("No tasks to archive.")
+        return
+    # Pas de sync.track: le manifeste devient périmé et la prochaine
+    # synchronisation retrouve les tâches archivées (voir sync.refresh)
+    print(f"Archived {len(archived)} task(s) to {archive.archive_path(filename)}.")
+
+
+def stats(filename, as_json=False):
+    """
+    Commande CLI pour afficher des statistiques sur les tâches d'un fichier.
+    
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        as_json (bool, optional): Affiche le résultat en JSON au lieu du texte
+        
+    Side Effects:
+        - Affiche les statistiques sur stdout
+        
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+        
+    Note:
+        Le fichier est parcouru ligne par ligne en un seul passage (voir core.stats),
+        sans être chargé en mémoire. L'archive n'est lue que s'il manque des IDs,
+        pour ne pas compter les tâches archivées comme manquantes.
+        
+    Example:
+        >>> stats("tasks.txt")
+        Tasks: 3 (1 without labels)
+        IDs: 1..4, 1 missing (2)
+        ...
+    """
+    with open(filename, 'r') as f:
+        result = core.stats(f, archive.iter_archive(filename))
+    
+    if as_json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+    
+    ids = result["ids"]
+    lengths = result["description_length"]
+    print(f"Tasks: {result['tasks']} ({result['unlabeled']} without labels)")
+    if not result["tasks"]:
+        return
+    
+    # IDs et plages laissées par rm
+    if ids["gaps"] is None:
+        gaps_str = "file not sorted by id"
+    else:
+        gaps_str = ", ".join(str(start) if start == end else f"{start}-{end}"
+                             for start, end in ids["gaps"])
+    print(f"IDs: {ids['min']}..{ids['max']}, {ids['missing']} missing"
+          + (f" ({gaps_str})" if ids["missing"] else ""))
+    
+    if result["labels"]:
+        print("Labels:")
+        for label, n in result["labels"].items():
+            print(f"  {label}: {n}")
+    
+    if result["co_occurrence"]:
+        print("Label co-occurrence:")
+        for pair, n in result["co_occurrence"].items():
+            print(f"  {pair}: {n}")
+    
+    print(f"Description length: min {lengths['min']}, max {lengths['max']}, mean {lengths['mean']}")
+    for bucket, n in lengths["histogram"].items():
+        print(f"  {bucket}: {n}")
+
+
+def import_tasks(filename, source, fmt=None):
+    """
+    Commande CLI pour importer des tâches en masse depuis un fichier CSV ou JSONL.
+    
+    Args:
+        filename (str): Chemin vers le fichier de tâches (créé s'il n'existe pas)
+        source (str): Fichier à importer ('-' pour l'entrée standard)
+        fmt (str, optional): 'csv' ou 'jsonl' (déduit de l'extension sinon)
+        
+    Side Effects:
+        - Ajoute les tâches valides à la fin du fichier de tâches
+        - Affiche les enregistrements ignorés et un résumé de l'import
+        
+    Note:
+        - Le plus grand ID existant est calculé une seule fois (fichier et archive),
+          puis un bloc d'IDs contigus est attribué aux tâches importées
+        - Entrée et sortie sont traitées en flux avec une seule ouverture en ajout
+          et un tampon d'écriture: la mémoire reste bornée quelle que soit la taille
+        - Les enregistrements invalides (';' dans un champ, ',' dans un label...)
+          sont ignorés et signalés avec leur numéro de ligne
+        - Une erreur de lecture de la source (encodage, CSV illisible...) arrête
+          l'import: les tâches déjà ajoutées sont conservées et comptées
+        
+    Example:
+        >>> import_tasks("tasks.txt", "backlog.csv")
+        Imported 2 task(s) (IDs 4-5).
+    """
+    try:
+        fmt = transfer.guess_format(None if source == '-' else source, fmt)
+    except ValueError as e:
+        print(f"Error: {e}.")
+        return
+    
+    # Allocation du bloc d'IDs: un seul passage sur le fichier existant
+    try:
+        with open(filename, 'r') as f:
+            first_id = max(core.max_id(f), archive.read_max_id(filename)) + 1
+        with open(filename, 'rb') as f:
+            # Garantit que la première tâche importée commence sur une nouvelle ligne
+            missing_newline = False
+            if f.seek(0, 2) > 0:
+                f.seek(-1, 2)
+                missing_newline = f.read(1) != b"\n"
+    except FileNotFoundError:
+        first_id = archive.read_max_id(filename) + 1
+        missing_newline = False
+    
+    next_id = first_id
+    skipped = 0
+    before = sync.snapshot(filename)
+    try:
+        src = sys.stdin if source == '-' else open(source, 'r', newline='')
+    except FileNotFoundError:
+        print(f"Error: The file {source} was not found")
+        return
+    
+    try:
+        with open(filename, 'a', buffering=1 << 20) as out:
+            if missing_newline:
+                out.write("\n")
+            for line_no, raw in transfer.read_records(src, fmt):
+                try:
+                    description, labels = transfer.parse_record(raw, fmt)
+                    core.validate_task(description, labels)
+                except ValueError as e:
+                    skipped += 1
+                    print(f"Skipped line {line_no}: {e}")
+                    continue
+                out.write(f"{next_id};{description};{','.join(labels)}\n")
+                next_id += 1
+    except FileNotFoundError:
+        # Répertoire du fichier de tâches inexistant
+        print(f"Error: The file {filename} was not found")
+        return
+    except ValueError as e:
+        # Source illisible: les tâches déjà écrites restent dans le fichier
+        print(f"Error: {e}.")
+    finally:
+        if src is not sys.stdin:
+            src.close()
+    
+    sync.track(filename, before)
+    imported = next_id - first_id
+    if imported:
+        print(f"Imported {imported} task(s) (IDs {first_id}-{next_id - 1}).")
+    else:
+        print("No tasks imported.")
+    if skipped:
+        print(f"Skipped {skipped} invalid record(s).")
+
+
+def export_tasks(filename, destination=None, fmt=None, include_archive=False):
+    """
+    Commande CLI pour exporter les tâches au format CSV ou JSONL.
+    
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        destination (str, optional): Fichier de sortie (sortie standard si None ou '-')
+        fmt (str, optional): 'csv' ou 'jsonl' (déduit de l'extension, CSV sur stdout)
+        include_archive (bool, optional): Exporte aussi les tâches archivées
+        
+    Side Effects:
+        - Écrit les tâches dans le fichier de sortie ou sur stdout
+        
+    Raises:
+        FileNotFoundError: Si le fichier de tâches n'existe pas
+        
+    Note:
+        Le fichier de tâches est parcouru ligne par ligne: la mémoire reste bornée.
+        
+    Example:
+        >>> export_tasks("tasks.txt", fmt="jsonl")
+        {"id": 1, "description": "Faire les courses", "labels": ["urgent"]}
+    """
+    to_stdout = destination in (None, '-')
+    if to_stdout and fmt is None:
+        # Pas d'extension à analyser sur la sortie standard
+        fmt = 'csv'
+    try:
+        fmt = transfer.guess_format(None if to_stdout else destination, fmt)
+    except ValueError as e:
+        print(f"Error: {e}.")
+        return
+    
+    with open(filename, 'r') as f:
+        lines = itertools.chain(f, archive.iter_archive(filename)) if include_archive else f
+        if to_stdout:
+            transfer.write_records(sys.stdout, fmt, core.iter_tasks(lines))
+        else:
+            try:
+                out = open(destination, 'w', newline='', buffering=1 << 20)
+            except FileNotFoundError:
+                print(f"Error: The file {destination} was not found")
+                return
+            with out:
+                count = transfer.write_records(out, fmt, core.iter_tasks(lines))
+            print(f"Exported {count} task(s) to {destination}.")
+
+
+def sync_files(filename, replica):
+    """
+    Commande CLI pour synchroniser deux copies d'un fichier de tâches.
+    
+    Args:
+        filename (str): Chemin vers la première copie (A, prioritaire à date égale)
+        replica (str): Chemin vers la seconde copie (B, créée si elle n'existe pas)
+        
+    Side Effects:
+        - Met à jour les manifestes <fichier>.manifest des deux copies
+        - Réécrit chaque copie qui a des changements à recevoir
+        - Affiche le nombre de tâches ajoutées, modifiées et supprimées de chaque côté
+        - Signale à part les IDs changés dans les deux copies depuis la dernière
+          synchronisation (conflits)
+        
+    Note:
+        Seules les tâches dont l'empreinte diffère entre les deux manifestes sont
+        transférées; pour un ID modifié des deux côtés, le changement le plus
+        récent l'emporte (voir module sync), l'autre version est perdue.
+        
+    Example:
+        >>> sync_files("lestaches.txt", "copie.txt")
+        lestaches.txt -> copie.txt: 1 added, 0 updated, 0 removed.
+        copie.txt -> lestaches.txt: 0 added, 1 updated, 0 removed, 1 conflict(s).
+        Warning: 1 task(s) changed in both copies since the last sync, most recent version kept: 4
+    """
+    if os.path.abspath(filename) == os.path.abspath(replica):
+        print("Error: cannot sync a file with itself.")
+        return
+    
+    entries_a = sync.refresh(filename)
+    entries_b = sync.refresh(replica)
+    to_a, to_b = sync.plan(entries_a, entries_b)
+    conflicts = sync.find_conflicts(entries_a, entries_b, sync.last_sync(filename, replica))
+    
+    if not to_a and not to_b:
+        print("Already in sync.")
+    
+    for source, target, changes, target_entries in ((filename, replica, to_b, entries_b),
+                                                    (replica, filename, to_a, entries_a)):
+        if changes:
+            try:
+                added, updated, removed, resolved = sync.apply(source, target, changes,
+                                                               target_entries, conflicts)
+            except FileNotFoundError:
+                # Répertoire de la copie cible inexistant
+                print(f"Error: The file {target} was not found")
+                return
+            print(f"{source} -> {target}: {added} added, {updated} updated, {removed} removed"
+                  + (f", {resolved} conflict(s)." if resolved else "."))
+    
+    if conflicts:
+        shown = ", ".join(map(str, conflicts[:MAX_LISTED_CONFLICTS]))
+        if len(conflicts) > MAX_LISTED_CONFLICTS:
+            shown += ", ..."
+        print(f"Warning: {len(conflicts)} task(s) changed in both copies since the last sync, "
+              f"most recent version kept: {shown}")
+    sync.mark_synced(filename, replica)
@@ -9,6 +9,9 @@ Format des tâches: Chaque tâche est stockée sous forme "ID;Description" dans
 Auteurs: Groupe 4 - Codecamp
 """
 
+import bisect
+import math
+
 
 def parse_tasks(tasks):
     """
@@ -30,7 +33,23 @@ def parse_tasks(tasks):
         >>> parse_tasks(["1;Faire les courses;urgent,personnel", "2;Réviser"])
         [(1, 'Faire les courses', ['urgent', 'personnel']), (2, 'Réviser', [])]
     """
-    parsed_tasks = []
+    return list(iter_tasks(tasks))
+
+
+def iter_tasks(tasks):
+    """
+    Version paresseuse de parse_tasks: produit les tâches une par une.
+    
+    Args:
+        tasks (iterable): Lignes du fichier de tâches (liste, fichier ouvert, générateur...)
+        
+    Yields:
+        tuple: (id: int, description: str, labels: list) pour chaque ligne valide
+        
+    Note:
+        Mêmes règles que parse_tasks, sans matérialiser la liste complète:
+        permet de parcourir un fichier ouvert en mémoire constante.
+    """
     for line in tasks:
         line = line.strip()
         if line:  # Ignore empty lines
@@ -44,14 +63,13 @@ def parse_tasks(tasks):
                         labels = [label.strip() for label in parts[2].split(",") if label.strip()]
                     else:
                         labels = []
-                    parsed_tasks.append((tid, description, labels))
+                    yield (tid, description, labels)
                 except ValueError:
                     # Ignore les lignes avec un ID non numérique
                     continue
-    return parsed_tasks
 
 
-def add(tasks, details, labels=None):
+def add(tasks, details, labels=None, known_max_id=0):
     """
     Ajoute une nouvelle tâche avec un ID auto-incrémenté et des labels optionnels.
     
@@ -59,6 +77,8 @@ def add(tasks, details, labels=None):
         tasks (list): Liste des lignes existantes du fichier de tâches
         details (str): Description de la nouvelle tâche
         labels (list, optional): Liste des labels à associer à la tâche
+        known_max_id (int, optional): Plus grand ID déjà attribué hors de tasks
+                                      (archive, IDs lus par l'appelant...)
         
     Returns:
         tuple: (new_id: int, description: str, labels: list, task_line: str)
@@ -68,8 +88,9 @@ def add(tasks, details, labels=None):
             - task_line: La ligne formatée à écrire dans le fichier
             
     Note:
-        - L'ID est calculé comme max(IDs existants) + 1
-        - Si aucune tâche n'existe, l'ID commence à 1
+        - L'ID est calculé comme max(IDs existants, known_max_id) + 1
+        - Les IDs restent ainsi uniques entre le fichier et son archive
+        - Si aucune tâche n'existe, l'ID commence à known_max_id + 1
         - La ligne retournée inclut le saut de ligne final
         - Si labels est None, une liste vide est utilisée
         
@@ -85,10 +106,10 @@ def add(tasks, details, labels=None):
     if parsed_tasks:
         # Calcule l'ID maximum et ajoute 1
         max_id = max(task[0] for task in parsed_tasks)
-        new_id = max_id + 1
+        new_id = max(max_id, known_max_id) + 1
     else:
-        # Premier ID si aucune tâche n'existe
-        new_id = 1
+        # Premier ID si aucune tâche n'existe (hors archive)
+        new_id = known_max_id + 1
     
     # Formate la ligne pour l'écriture dans le fichier
     labels_str = ",".join(labels) if labels else ""
@@ -96,6 +117,49 @@ def add(tasks, details, labels=None):
     return (new_id, details, labels, new_task_line)
 
 
+def max_id(tasks):
+    """
+    Retourne le plus grand ID présent, en un seul passage sur les lignes.
+    
+    Args:
+        tasks (iterable): Lignes du fichier de tâches (un fichier ouvert convient)
+        
+    Returns:
+        int: Plus grand ID, 0 si aucune tâche
+        
+    Example:
+        >>> max_id(["1;Tâche;", "7;Autre;"])
+        7
+    """
+    return max((tid for tid, _, _ in iter_tasks(tasks)), default=0)
+
+
+def validate_task(description, labels):
+    """
+    Vérifie qu'une tâche peut être écrite dans le format "ID;Description;Labels".
+    
+    Args:
+        description (str): Description de la tâche
+        labels (list): Labels de la tâche
+        
+    Raises:
+        ValueError: Si la description contient ';' ou un retour à la ligne, ou si
+                    un label contient ';', ',' ou un retour à la ligne
+        
+    Example:
+        >>> validate_task("Courses; marché", [])
+        Traceback (most recent call last):
+        ValueError: description contains ';'
+    """
+    for char, name in ((";", "';'"), ("\n", "a newline"), ("\r", "a newline")):
+        if char in description:
+            raise ValueError(f"description contains {name}")
+    for label in labels:
+        for char, name in ((";", "';'"), (",", "','"), ("\n", "a newline"), ("\r", "a newline")):
+            if char in label:
+                raise ValueError(f"label '{label.strip()}' contains {name}")
+
+
 def modify(tasks, task_id, new_details, new_labels=None):
     """
     Modifie la description et/ou les labels d'une tâche existante par son ID.
@@ -133,11 +197,9 @@ def modify(tasks, task_id, new_details, new_labels=None):
     found = False
     
     # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, labels) in enumerate(parsed_tasks):
-        if tid == task_id:
-            # Utilise les nouveaux labels si fournis, sinon garde les existants
-            updated_labels = new_labels if new_labels is not None else labels
-            parsed_tasks[i] = (tid, new_details, updated_labels)
+    for i, task in enumerate(parsed_tasks):
+        if task[0] == task_id:
+            parsed_tasks[i] = modify_task(task, new_details, new_labels)
             found = True
             break
     
@@ -211,13 +273,30 @@ def show(tasks, label_filter=None):
         | 2   | Seconde tâche | urgent   |
         +-----+---------------+----------+
     """
-    # Parse et vérifie s'il y a des tâches
-    parsed_tasks = parse_tasks(tasks)
-    
+    # Parse puis délègue l'affichage du tableau
+    show_parsed(parse_tasks(tasks), label_filter)
+
+
+def show_parsed(parsed_tasks, label_filter=None, with_source=False):
+    """
+    Affiche des tâches déjà analysées dans un tableau formaté, triées par ID.
+
+    Args:
+        parsed_tasks (list): Tuples (id, description, labels) retournés par parse_tasks
+        label_filter (str, optional): Filtre pour n'afficher que les tâches avec ce label
+        with_source (bool, optional): Les tuples ont un 4e élément (fichier d'origine)
+                                      affiché dans une colonne "file"
+
+    Returns:
+        None: Affiche directement le résultat sur stdout
+
+    Note:
+        Permet aux appelants qui maintiennent déjà une liste de tâches
+        (ex: show --watch, show --files) d'éviter de ré-analyser les fichiers.
+    """
     # Applique le filtre par label si spécifié
     if label_filter:
-        parsed_tasks = [(tid, desc, labels) for tid, desc, labels in parsed_tasks 
-                       if label_filter in labels]
+        parsed_tasks = [task for task in parsed_tasks if label_filter in task[2]]
     
     if not parsed_tasks:
         if label_filter:
@@ -226,28 +305,62 @@ def show(tasks, label_filter=None):
             print("No tasks found.")
         return
     
-    # Trie les tâches par ID croissant
+    # Trie les tâches par ID croissant (tri stable, linéaire si déjà trié)
     sorted_tasks = sorted(parsed_tasks, key=lambda x: x[0])
     
     # Calcule les largeurs optimales pour les colonnes
-    max_desc_length = max(len(desc) for _, desc, _ in sorted_tasks) if sorted_tasks else 10
+    max_desc_length = max(len(task[1]) for task in sorted_tasks) if sorted_tasks else 10
     max_desc_length = max(max_desc_length, 11)  # Largeur minimale pour "description"
     
-    max_labels_length = max(len(",".join(labels)) for _, _, labels in sorted_tasks) if sorted_tasks else 6
+    max_labels_length = max(len(",".join(task[2])) for task in sorted_tasks) if sorted_tasks else 6
     max_labels_length = max(max_labels_length, 6)  # Largeur minimale pour "labels"
     
+    # Colonne supplémentaire pour le fichier d'origine
+    max_source_length = None
+    if with_source:
+        max_source_length = max(max(len(task[3]) for task in sorted_tasks), 4)
+    
+    print_table(sorted_tasks, max_desc_length, max_labels_length, max_source_length)
+
+
+def print_table(tasks, max_desc_length, max_labels_length, max_source_length=None):
+    """
+    Affiche un tableau de tâches avec des largeurs de colonnes déjà calculées.
+
+    Args:
+        tasks (iterable): Tuples (id, description, labels[, source]) dans l'ordre d'affichage
+        max_desc_length (int): Largeur de la colonne "description"
+        max_labels_length (int): Largeur de la colonne "labels"
+        max_source_length (int, optional): Largeur de la colonne "file" (absente si None)
+
+    Returns:
+        None: Affiche directement le résultat sur stdout
+
+    Note:
+        Les tâches sont consommées une par une: un itérateur convient, ce qui
+        permet d'afficher un résultat plus grand que la mémoire (show --sort).
+    """
     # Construction et affichage du tableau
     border_line = f"+-----+{'-' * (max_desc_length + 2)}+{'-' * (max_labels_length + 2)}+"
     header_line = f"| {'id':<3} | {'description':<{max_desc_length}} | {'labels':<{max_labels_length}} |"
     
+    # Colonne supplémentaire pour le fichier d'origine
+    if max_source_length is not None:
+        border_line += f"{'-' * (max_source_length + 2)}+"
+        header_line += f" {'file':<{max_source_length}} |"
+    
     print(border_line)
     print(header_line)
     print(border_line)
     
     # Affichage de chaque tâche
-    for task_id, description, labels in sorted_tasks:
+    for task in tasks:
+        task_id, description, labels = task[:3]
         labels_str = ",".join(labels) if labels else ""
-        print(f"| {task_id:<3} | {description:<{max_desc_length}} | {labels_str:<{max_labels_length}} |")
+        row = f"| {task_id:<3} | {description:<{max_desc_length}} | {labels_str:<{max_labels_length}} |"
+        if max_source_length is not None:
+            row += f" {task[3]:<{max_source_length}} |"
+        print(row)
     
     print(border_line)
 
@@ -282,11 +395,9 @@ def add_label(tasks, task_id, new_label):
     parsed_tasks = parse_tasks(tasks)
     found = False
     
-    for i, (tid, desc, labels) in enumerate(parsed_tasks):
-        if tid == task_id:
-            if new_label not in labels:
-                labels.append(new_label)
-            parsed_tasks[i] = (tid, desc, labels)
+    for i, task in enumerate(parsed_tasks):
+        if task[0] == task_id:
+            parsed_tasks[i] = add_label_task(task, new_label)
             found = True
             break
     
@@ -321,13 +432,10 @@ def rm_label(tasks, task_id, label_to_remove):
     found = False
     label_found = False
     
-    for i, (tid, desc, labels) in enumerate(parsed_tasks):
-        if tid == task_id:
+    for i, task in enumerate(parsed_tasks):
+        if task[0] == task_id:
             found = True
-            if label_to_remove in labels:
-                labels.remove(label_to_remove)
-                label_found = True
-            parsed_tasks[i] = (tid, desc, labels)
+            parsed_tasks[i], label_found = rm_label_task(task, label_to_remove)
             break
     
     return found, label_found, parsed_tasks
@@ -359,10 +467,319 @@ def set_labels(tasks, task_id, new_labels):
     parsed_tasks = parse_tasks(tasks)
     found = False
     
-    for i, (tid, desc, labels) in enumerate(parsed_tasks):
-        if tid == task_id:
-            parsed_tasks[i] = (tid, desc, new_labels.copy())
+    for i, task in enumerate(parsed_tasks):
+        if task[0] == task_id:
+            parsed_tasks[i] = set_labels_task(task, new_labels)
             found = True
             break
     
-    return found, parsed_tasks
\ No newline at end of file
+    return found, parsed_tasks
+
+
+def modify_task(task, new_details, new_labels=None):
+    """
+    Retourne une tâche avec une nouvelle description et, si fournis, de nouveaux labels.
+    
+    Args:
+        task (tuple): Tâche (id, description, labels)
+        new_details (str): Nouvelle description
+        new_labels (list, optional): Nouveaux labels (None = pas de changement)
+        
+    Returns:
+        tuple: Tâche modifiée (id, description, labels)
+        
+    Note:
+        Les fonctions *_task travaillent sur une seule tâche: elles sont utilisées par
+        les fonctions sur liste ci-dessus et par la réécriture en flux (module streaming).
+        
+    Example:
+        >>> modify_task((1, 'Ancienne', ['old']), "Nouvelle")
+        (1, 'Nouvelle', ['old'])
+    """
+    tid, desc, labels = task
+    # Utilise les nouveaux labels si fournis, sinon garde les existants
+    return (tid, new_details, new_labels if new_labels is not None else labels)
+
+
+def add_label_task(task, new_label):
+    """
+    Retourne une tâche avec un label ajouté (inchangée si le label existe déjà).
+    
+    Example:
+        >>> add_label_task((1, 'Ma tâche', ['urgent']), "important")
+        (1, 'Ma tâche', ['urgent', 'important'])
+    """
+    tid, desc, labels = task
+    if new_label not in labels:
+        labels.append(new_label)
+    return (tid, desc, labels)
+
+
+def rm_label_task(task, label_to_remove):
+    """
+    Retourne une tâche sans le label donné.
+    
+    Returns:
+        tuple: (task: tuple, label_found: bool) où label_found indique si le label
+               était présent
+        
+    Example:
+        >>> rm_label_task((1, 'Ma tâche', ['urgent', 'important']), "urgent")
+        ((1, 'Ma tâche', ['important']), True)
+    """
+    tid, desc, labels = task
+    label_found = label_to_remove in labels
+    if label_found:
+        labels.remove(label_to_remove)
+    return (tid, desc, labels), label_found
+
+
+def set_labels_task(task, new_labels):
+    """
+    Retourne une tâche dont les labels sont remplacés par une copie de new_labels.
+    
+    Example:
+        >>> set_labels_task((1, 'Ma tâche', ['ancien']), ["nouveau"])
+        (1, 'Ma tâche', ['nouveau'])
+    """
+    tid, desc, _ = task
+    return (tid, desc, new_labels.copy())
+
+
+def parse_id_range(id_range):
+    """
+    Convertit une plage d'IDs textuelle en bornes numériques.
+    
+    Args:
+        id_range (str): Plage au format "debut-fin", "debut-", "-fin" ou "id"
+        
+    Returns:
+        tuple: (start: int|None, end: int|None) bornes incluses, None = non bornée
+        
+    Raises:
+        ValueError: Si la plage n'est pas numérique
+        
+    Example:
+        >>> parse_id_range("10-20")
+        (10, 20)
+        >>> parse_id_range("-5")
+        (None, 5)
+    """
+    if "-" not in id_range:
+        tid = int(id_range)
+        return tid, tid
+    start, end = id_range.split("-", 1)
+    return (int(start) if start.strip() else None,
+            int(end) if end.strip() else None)
+
+
+def is_archivable(task, label=None, id_range=None):
+    """
+    Indique si une tâche correspond aux critères de la commande archive.
+    
+    Args:
+        task (tuple): Tâche (id, description, labels)
+        label (str, optional): Label requis
+        id_range (tuple, optional): Bornes (start, end) retournées par parse_id_range
+        
+    Returns:
+        bool: True si tous les critères fournis sont vérifiés
+        
+    Example:
+        >>> is_archivable((3, "Tâche", ["done"]), "done", (1, 10))
+        True
+    """
+    tid, _, labels = task
+    start, end = id_range if id_range else (None, None)
+    return ((label is None or label in labels)
+            and (start is None or tid >= start)
+            and (end is None or tid <= end))
+
+
+def archive(tasks, label=None, id_range=None):
+    """
+    Sépare les tâches à archiver des tâches à conserver dans le fichier.
+    
+    Args:
+        tasks (list): Liste des lignes existantes du fichier de tâches
+        label (str, optional): N'archive que les tâches portant ce label
+        id_range (tuple, optional): Bornes (start, end) retournées par parse_id_range
+        
+    Returns:
+        tuple: (archived: list, remaining: list)
+            - archived: Tâches sélectionnées pour l'archive
+            - remaining: Tâches conservées dans le fichier
+            
+    Note:
+        - Si label et id_range sont fournis, les deux critères doivent être vérifiés
+        - L'ordre des tâches dans le fichier est conservé
+        
+    Example:
+        >>> archive(["1;Tâche 1;done", "2;Tâche 2;urgent"], label="done")
+        ([(1, 'Tâche 1', ['done'])], [(2, 'Tâche 2', ['urgent'])])
+    """
+    archived = []
+    remaining = []
+    
+    for task in parse_tasks(tasks):
+        if is_archivable(task, label, id_range):
+            archived.append(task)
+        else:
+            remaining.append(task)
+    
+    return archived, remaining
+
+
+
+def stats(tasks, archived_tasks=()):
+    """
+    Calcule des statistiques sur les tâches en un seul passage.
+    
+    Args:
+        tasks (iterable): Lignes du fichier de tâches (un fichier ouvert convient)
+        archived_tasks (iterable, optional): Lignes du segment d'archive, dont les
+                                             IDs ne comptent pas comme manquants
+        
+    Returns:
+        dict: Statistiques avec les clés suivantes
+            - tasks: Nombre de tâches
+            - unlabeled: Nombre de tâches sans label
+            - labels: {label: nombre de tâches}
+            - co_occurrence: {"label1+label2": nombre de tâches portant les deux}
+            - ids: {min, max, missing, gaps} où missing est le nombre d'IDs entre
+              1 et max absents du fichier et de l'archive (laissés par rm) et gaps
+              la liste de ces plages [début, fin], ou None si le fichier n'est pas
+              trié par ID
+            - description_length: {min, max, mean, histogram} où histogram associe
+              une tranche de longueur ("0", "1", "2-3", "4-7", ...) au nombre de tâches
+            
+    Note:
+        - La mémoire utilisée dépend du nombre de labels distincts et de plages
+          manquantes, pas du nombre de tâches; seul un fichier non trié par ID
+          (ou avec des IDs répétés) oblige à mémoriser les IDs pour compter
+          les absents sans compter deux fois un ID répété
+        - Les longueurs de description sont regroupées par puissances de deux
+        - archived_tasks n'est parcouru que s'il reste des IDs manquants; les
+          plages sont alors découpées autour des IDs archivés, sans mémoriser
+          ces derniers (sauf fichier non trié)
+        
+    Example:
+        >>> stats(["1;Courses;urgent,perso", "3;Réviser;"])["ids"]
+        {'min': 1, 'max': 3, 'missing': 1, 'gaps': [[2, 2]]}
+    """
+    count = 0
+    unlabeled = 0
+    label_counts = {}
+    pair_counts = {}
+    min_id = None
+    max_id = None
+    previous_id = 0
+    gaps = []
+    # IDs rencontrés (>= 1), tenus seulement une fois le fichier reconnu non trié
+    seen_ids = None
+    min_length = None
+    max_length = 0
+    total_length = 0
+    # Tranche i = longueurs de bit_length() == i, soit [2^(i-1), 2^i - 1]
+    buckets = []
+    
+    for tid, desc, labels in iter_tasks(tasks):
+        count += 1
+        
+        # Labels et co-occurrences (paires non ordonnées, comptées une fois)
+        if labels:
+            unique_labels = sorted(set(labels))
+            for i, label in enumerate(unique_labels):
+                label_counts[label] = label_counts.get(label, 0) + 1
+                for other in unique_labels[i + 1:]:
+                    pair = f"{label}+{other}"
+                    pair_counts[pair] = pair_counts.get(pair, 0) + 1
+        else:
+            unlabeled += 1
+        
+        # Bornes des IDs et plages manquantes (tant que le fichier est trié)
+        min_id = tid if min_id is None else min(min_id, tid)
+        max_id = tid if max_id is None else max(max_id, tid)
+        if gaps is not None:
+            if tid <= previous_id:
+                # Fichier non trié: les IDs déjà vus sont exactement [1, previous_id]
+                # privé des plages manquantes
+                seen_ids = set()
+                start = 1
+                for gap_start, gap_end in gaps:
+                    seen_ids.update(range(start, gap_start))
+                    start = gap_end + 1
+                seen_ids.update(range(start, previous_id + 1))
+                gaps = None
+            else:
+                if tid > previous_id + 1:
+                    gaps.append([previous_id + 1, tid - 1])
+                previous_id = tid
+        if seen_ids is not None and tid >= 1:
+            seen_ids.add(tid)
+        
+        # Distribution des longueurs de description
+        length = len(desc)
+        min_length = length if min_length is None else min(min_length, length)
+        max_length = max(max_length, length)
+        total_length += length
+        bucket = length.bit_length()
+        if bucket >= len(buckets):
+            buckets.extend([0] * (bucket + 1 - len(buckets)))
+        buckets[bucket] += 1
+    
+    # Les IDs déplacés dans l'archive ne sont pas manquants
+    if gaps or (seen_ids is not None and len(seen_ids) < max_id):
+        for tid, _, _ in iter_tasks(archived_tasks):
+            if not 1 <= tid <= max_id:
+                continue
+            if seen_ids is not None:
+                seen_ids.add(tid)
+                continue
+            # Plage qui contient tid: dernière plage dont le début est <= tid
+            i = bisect.bisect_right(gaps, [tid, math.inf]) - 1
+            if i < 0 or gaps[i][1] < tid:
+                continue
+            start, end = gaps[i]
+            if start == end:
+                del gaps[i]
+            elif tid == start:
+                gaps[i][0] = tid + 1
+            elif tid == end:
+                gaps[i][1] = tid - 1
+            else:
+                gaps[i][1] = tid - 1
+                gaps.insert(i + 1, [tid + 1, end])
+    
+    # IDs absents entre 1 et max (un ID répété ne compte qu'une fois)
+    if gaps is not None:
+        missing = sum(end - start + 1 for start, end in gaps)
+    elif max_id is not None and max_id >= 1:
+        missing = max_id - len(seen_ids)
+    else:
+        missing = 0
+    
+    histogram = {}
+    for i, n in enumerate(buckets):
+        if n:
+            low, high = (0, 0) if i == 0 else (1 << (i - 1), (1 << i) - 1)
+            histogram[str(low) if low == high else f"{low}-{high}"] = n
+    
+    return {
+        "tasks": count,
+        "unlabeled": unlabeled,
+        "labels": dict(sorted(label_counts.items(), key=lambda x: (-x[1], x[0]))),
+        "co_occurrence": dict(sorted(pair_counts.items(), key=lambda x: (-x[1], x[0]))),
+        "ids": {
+            "min": min_id,
+            "max": max_id,
+            "missing": missing,
+            "gaps": gaps,
+        },
+        "description_length": {
+            "min": min_length,
+            "max": max_length if count else None,
+            "mean": round(total_length / count, 2) if count else None,
+            "histogram": histogram,
+        },
+    }
@@ -0,0 +1,180 @@
+"""
+External sort module for task lists larger than memory.
+
+Ce module trie un flux de tâches sous un budget mémoire: les tâches sont
+accumulées par paquets (« runs ») qui sont triés puis écrits dans des fichiers
+temporaires dès que le budget est dépassé, et les runs sont ensuite fusionnés
+avec heapq.merge. Les runs utilisent le format du fichier de tâches
+("ID;Description;Labels") et sont relus avec core.iter_tasks.
+
+Chaque run fusionné garde un fichier ouvert: au-delà de MAX_MERGE_RUNS runs,
+des fusions intermédiaires regroupent les runs par paquets de MAX_MERGE_RUNS
+(en plusieurs passes si nécessaire) pour ne jamais dépasser cette limite.
+
+Clés de tri disponibles:
+    - id          : ID numérique
+    - description : description, puis ID
+    - labels      : labels joints par des virgules, puis ID
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import heapq
+import os
+
+import core
+
+SORT_KEYS = {
+    'id': lambda task: task[0],
+    'description': lambda task: (task[1], task[0]),
+    'labels': lambda task: (",".join(task[2]), task[0]),
+}
+
+# Coût approximatif en mémoire d'une tâche en plus de ses chaînes (tuple, liste, int)
+TASK_OVERHEAD = 200
+
+# Nombre maximal de runs fusionnés à la fois (un fichier ouvert par run)
+MAX_MERGE_RUNS = 128
+
+
+def task_size(task):
+    """
+    Estime la place occupée en mémoire par une tâche analysée.
+
+    Args:
+        task (tuple): Tuple (id, description, labels)
+
+    Returns:
+        int: Estimation en octets (approximation, pas une mesure exacte)
+    """
+    return TASK_OVERHEAD + len(task[1]) + sum(len(label) + 50 for label in task[2])
+
+
+def write_run(tasks, directory, index):
+    """
+    Écrit un run trié dans un fichier temporaire.
+
+    Args:
+        tasks (iterable): Tuples (id, description, labels) déjà triés
+        directory (str): Répertoire temporaire des runs
+        index (int): Numéro du run (sert au nom du fichier)
+
+    Returns:
+        str: Chemin du fichier écrit
+    """
+    path = os.path.join(directory, f"run-{index}.txt")
+    with open(path, 'w', buffering=1 << 20) as f:
+        for tid, desc, labels in tasks:
+            f.write(f"{tid};{desc};{','.join(labels)}\n")
+    return path
+
+
+def read_run(path):
+    """
+    Relit un run écrit par write_run, tâche par tâche.
+
+    Yields:
+        tuple: (id, description, labels) dans l'ordre du run
+    """
+    with open(path, 'r', buffering=1 << 20) as f:
+        yield from core.iter_tasks(f)
+
+
+def reduce_runs(run_paths, directory, key, descending, next_index):
+    """
+    Fusionne des runs par paquets jusqu'à en avoir au plus MAX_MERGE_RUNS.
+
+    Args:
+        run_paths (list): Chemins des runs triés, dans l'ordre de leur écriture
+        directory (str): Répertoire temporaire des runs
+        key (callable): Clé de tri (voir SORT_KEYS)
+        descending (bool): Tri décroissant
+        next_index (int): Premier numéro libre pour les nouveaux runs
+
+    Returns:
+        list: Chemins des runs restants, dans le même ordre relatif
+
+    Note:
+        Les paquets regroupent des runs consécutifs et heapq.merge est stable:
+        à clé égale, l'ordre d'origine des tâches est conservé. Les runs
+        fusionnés sont supprimés aussitôt pour limiter la place sur disque.
+    """
+    while len(run_paths) > MAX_MERGE_RUNS:
+        merged_paths = []
+        for start in range(0, len(run_paths), MAX_MERGE_RUNS):
+            group = run_paths[start:start + MAX_MERGE_RUNS]
+            if len(group) == 1:
+                merged_paths.append(group[0])
+                continue
+            merged = heapq.merge(*[read_run(path) for path in group],
+                                 key=key, reverse=descending)
+            merged_paths.append(write_run(merged, directory, next_index))
+            next_index += 1
+            for path in group:
+                os.remove(path)
+        run_paths = merged_paths
+    return run_paths
+
+
+def sort_tasks(tasks, sort_key='id', descending=False, max_memory=64 << 20, directory=None):
+    """
+    Trie un flux de tâches en respectant un budget mémoire.
+
+    Args:
+        tasks (iterable): Tuples (id, description, labels), consommés en flux
+        sort_key (str, optional): 'id', 'description' ou 'labels'
+        descending (bool, optional): Tri décroissant
+        max_memory (int, optional): Budget mémoire approximatif en octets pour un run
+        directory (str, optional): Répertoire temporaire pour les runs (requis si le
+                                   budget est dépassé)
+
+    Yields:
+        tuple: (id, description, labels) dans l'ordre demandé
+
+    Note:
+        - Tout le flux d'entrée est consommé avant la première tâche produite
+        - Au plus MAX_MERGE_RUNS fichiers de runs sont ouverts en même temps
+        - Si le tri est par ID croissant et que l'entrée est déjà dans cet ordre
+          (cas normal: add écrit les IDs dans l'ordre), aucun tri n'est effectué
+          et les runs sont simplement enchaînés
+        - Les fichiers de runs restent dans directory: à l'appelant de le nettoyer
+    """
+    key = SORT_KEYS[sort_key]
+    check_order = sort_key == 'id' and not descending
+    in_order = True
+    previous_id = None
+    run = []
+    run_size = 0
+    run_paths = []
+
+    for task in tasks:
+        if check_order and in_order:
+            in_order = previous_id is None or task[0] >= previous_id
+            previous_id = task[0]
+        run.append(task)
+        run_size += task_size(task)
+
+        # Budget dépassé: le run est trié (si nécessaire) et écrit sur disque
+        if run_size >= max_memory:
+            if not (check_order and in_order):
+                run.sort(key=key, reverse=descending)
+            run_paths.append(write_run(run, directory, len(run_paths)))
+            run = []
+            run_size = 0
+
+    if not (check_order and in_order):
+        run.sort(key=key, reverse=descending)
+
+    if not run_paths:
+        # Tout tient en mémoire
+        yield from run
+    elif check_order and in_order:
+        # Entrée déjà triée: les runs se suivent
+        for path in run_paths:
+            yield from read_run(path)
+        yield from run
+    else:
+        # Fusion k-voies des runs écrits et du dernier run en mémoire
+        run_paths = reduce_runs(run_paths, directory, key, descending, len(run_paths))
+        yield from heapq.merge(*[read_run(path) for path in run_paths], run,
+                               key=key, reverse=descending)
@@ -0,0 +1,192 @@
+"""
+Fast parser module for whole task files.
+
+Ce module analyse un fichier de tâches complet en une seule lecture binaire,
+avec le même résultat que core.parse_tasks(f.readlines()), mais en confiant
+l'essentiel du travail aux méthodes de str (implémentées en C) plutôt qu'à une
+boucle Python par ligne.
+
+Stratégie:
+    - Le contenu est décodé en une fois, puis découpé en lignes
+    - Si chaque ligne a exactement trois champs "ID;Description;Labels" (forme
+      écrite par les commandes), un seul split(";") donne toutes les colonnes:
+      les IDs sont convertis avec map(int, ...) et les labels ne sont analysés
+      qu'une fois par valeur distincte du champ
+    - Sinon (lignes vides, ancien format "ID;Description", champs en trop...),
+      les lignes déjà découpées sont confiées à core.iter_tasks
+    - Le ramasse-miettes cyclique est suspendu pendant l'analyse: les centaines
+      de milliers de tuples et de listes créés ne contiennent aucun cycle, mais
+      leur allocation déclencherait sinon des collectes répétées
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import contextlib
+import gc
+import locale
+import operator
+import re
+
+import core
+
+# Premier champ des lignes qui contiennent au moins un ';'
+FIRST_FIELD = re.compile(r"^([^;\n]*);", re.M)
+
+# Nombre de ';' d'une ligne
+count_separators = operator.methodcaller('count', ';')
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """
+    Suspend le ramasse-miettes cyclique le temps d'un bloc.
+
+    Note:
+        Le ramasse-miettes n'est réactivé que s'il l'était à l'entrée du bloc.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def decode(data, encoding=None):
+    """
+    Décode le contenu brut d'un fichier comme open() en mode texte.
+
+    Args:
+        data (bytes): Contenu du fichier
+        encoding (str, optional): Encodage (par défaut celui de open())
+
+    Returns:
+        str: Texte avec les fins de ligne "\\r\\n" et "\\r" converties en "\\n"
+
+    Example:
+        >>> decode(b"1;a;\\r\\n2;b;\\r", "utf-8")
+        '1;a;\\n2;b;\\n'
+    """
+    text = data.decode(encoding or locale.getpreferredencoding(False))
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def parse_labels(field):
+    """
+    Analyse un champ de labels avec les règles de core.parse_tasks.
+
+    Example:
+        >>> parse_labels(" urgent, ,perso ")
+        ['urgent', 'perso']
+    """
+    if not field.strip():
+        return []
+    return [label.strip() for label in field.split(",") if label.strip()]
+
+
+def parse_text(text):
+    """
+    Analyse le contenu décodé d'un fichier de tâches.
+
+    Args:
+        text (str): Contenu du fichier (voir decode)
+
+    Returns:
+        list: Tuples (id: int, description: str, labels: list), identiques à
+              core.parse_tasks(text.splitlines(True))
+
+    Example:
+        >>> parse_text("1;Faire les courses;urgent,personnel\\n2;Reviser;\\n")
+        [(1, 'Faire les courses', ['urgent', 'personnel']), (2, 'Reviser', [])]
+    """
+    # Les espaces de fin ne touchent que des lignes vides ou les labels de la
+    # dernière ligne, nettoyés de toute façon
+    body = text.rstrip()
+    if not body:
+        return []
+    lines = body.split("\n")
+
+    with gc_paused():
+        if set(map(count_separators, lines)) == {2}:
+            # Chaque ligne a trois champs: les colonnes sont des tranches du découpage
+            fields = body.replace("\n", ";").split(";")
+            try:
+                # Même conversion que core.parse_tasks (int ignore les espaces autour)
+                ids = list(map(int, fields[0::3]))
+            except ValueError:
+                # ID non numérique: la ligne doit être ignorée, voir core.iter_tasks
+                pass
+            else:
+                label_fields = fields[2::3]
+                labels = {field: parse_labels(field) for field in set(label_fields)}
+                # Chaque tâche reçoit sa propre copie de la liste de labels
+                return list(zip(ids, fields[1::3],
+                                map(list.copy, map(labels.__getitem__, label_fields))))
+
+        return list(core.iter_tasks(lines))
+
+
+def parse(data, encoding=None):
+    """
+    Analyse le contenu brut (bytes) d'un fichier de tâches.
+
+    Example:
+        >>> parse(b"1;Faire les courses;urgent\\r\\n", "utf-8")
+        [(1, 'Faire les courses', ['urgent'])]
+    """
+    return parse_text(decode(data, encoding))
+
+
+def parse_ids(data, encoding=None):
+    """
+    Retourne seulement les IDs des tâches, sans analyser descriptions ni labels.
+
+    Args:
+        data (bytes): Contenu du fichier
+        encoding (str, optional): Encodage (par défaut celui de open())
+
+    Returns:
+        list: IDs dans l'ordre du fichier, identiques à ceux de core.parse_tasks
+
+    Example:
+        >>> parse_ids(b"1;a;\\n3;b;x\\n", "utf-8")
+        [1, 3]
+    """
+    body = decode(data, encoding).rstrip()
+    if not body:
+        return []
+
+    with gc_paused():
+        first_fields = FIRST_FIELD.findall(body)
+        if len(first_fields) == body.count("\n") + 1:
+            # Chaque ligne a au moins deux champs
+            try:
+                return list(map(int, first_fields))
+            except ValueError:
+                pass
+        return [task[0] for task in core.iter_tasks(body.split("\n"))]
+
+
+def max_id(data, encoding=None):
+    """
+    Retourne le plus grand ID présent dans le contenu brut (0 si aucune tâche).
+
+    Example:
+        >>> max_id(b"1;a;\\n7;b;\\n", "utf-8")
+        7
+    """
+    return max(parse_ids(data, encoding), default=0)
+
+
+def parse_file(filename, encoding=None):
+    """
+    Lit et analyse un fichier de tâches en une seule lecture binaire.
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+    """
+    with open(filename, 'rb') as f:
+        return parse(f.read(), encoding)
@@ -6,6 +6,7 @@ Il définit la structure des commandes disponibles et leurs arguments.
 
 Structure CLI:
     python task.py <fichier> <commande> [arguments]
+    python task.py --files <motif> show [arguments]
 
 Commandes disponibles:
     - add <description>        : Ajoute une nouvelle tâche
@@ -15,6 +16,11 @@ Commandes disponibles:
     - add-label <id> <label>  : Ajoute un label à une tâche
     - rm-label <id> <label>   : Supprime un label d'une tâche
     - set-labels <id> <labels>: Remplace les labels d'une tâche
+    - archive                 : Déplace des tâches vers l'archive (tiers froid)
+    - stats                   : Statistiques sur les labels, IDs et descriptions
+    - import <source>         : Importe des tâches en masse (CSV ou JSONL)
+    - export [destination]    : Exporte les tâches (CSV ou JSONL)
+    - sync <copie>            : Synchronise le fichier avec une autre copie
 
 Auteurs: Groupe 4 - Codecamp
 """
@@ -22,6 +28,63 @@ Auteurs: Groupe 4 - Codecamp
 import argparse
 
 
+def memory_size(value):
+    """
+    Convertit une taille mémoire textuelle en octets (type argparse).
+    
+    Args:
+        value (str): Taille avec suffixe optionnel K, M ou G (ex: "512K", "64M")
+        
+    Returns:
+        int: Taille en octets
+        
+    Raises:
+        argparse.ArgumentTypeError: Si la taille est invalide ou nulle
+        
+    Example:
+        >>> memory_size("64M")
+        67108864
+    """
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = value.strip().upper().rstrip('B')
+    multiplier = units.get(text[-1:], 1)
+    if text[-1:] in units:
+        text = text[:-1]
+    try:
+        size = int(float(text) * multiplier)
+    except (ValueError, OverflowError):
+        raise argparse.ArgumentTypeError(f"invalid memory size '{value}'")
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"invalid memory size '{value}'")
+    return size
+
+
+def positive_seconds(value):
+    """
+    Convertit une durée textuelle en secondes strictement positives (type argparse).
+    
+    Args:
+        value (str): Durée en secondes (ex: "0.5")
+        
+    Returns:
+        float: Durée en secondes
+        
+    Raises:
+        argparse.ArgumentTypeError: Si la durée est invalide, nulle, négative ou infinie
+        
+    Example:
+        >>> positive_seconds("0.5")
+        0.5
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid duration '{value}'")
+    if not 0 < seconds < float('inf'):
+        raise argparse.ArgumentTypeError(f"invalid duration '{value}'")
+    return seconds
+
+
 def create_parser():
     """
     Crée et configure l'analyseur de ligne de commande.
@@ -45,11 +108,16 @@ def create_parser():
         epilog='Exemple: python task.py lestaches.txt add "Faire les courses"'
     )
     
-    # Argument positionnel obligatoire : le fichier de tâches
+    # Argument positionnel : le fichier de tâches (omis avec --files)
     parser.add_argument(
         'file', 
+        nargs='?',
         help='Chemin vers le fichier contenant les tâches'
     )
+    parser.add_argument(
+        '--files', 
+        help="Motif glob de plusieurs fichiers de tâches, pour la commande show (ex: 'teams/*.txt')"
+    )
     
     # Sous-parseurs pour les différentes commandes
     subparsers = parser.add_subparsers(
@@ -114,6 +182,44 @@ def create_parser():
         '--filter', 
         help="Filtre pour n'afficher que les tâches ayant ce label"
     )
+    parser_show.add_argument(
+        '--all', 
+        action='store_true',
+        help="Inclut les tâches archivées (lecture du segment d'archive)"
+    )
+    parser_show.add_argument(
+        '--sort', 
+        choices=['id', 'description', 'labels'],
+        help="Trie les tâches sur cette colonne (tri externe, adapté aux gros fichiers)"
+    )
+    parser_show.add_argument(
+        '--desc', 
+        action='store_true',
+        help="Avec --sort, trie par ordre décroissant"
+    )
+    parser_show.add_argument(
+        '--max-memory', 
+        dest='max_memory',
+        type=memory_size,
+        default='64M',
+        help="Avec --sort, mémoire maximale avant écriture sur disque (ex: 512K, 64M; défaut: 64M)"
+    )
+    parser_show.add_argument(
+        '--watch', 
+        action='store_true',
+        help="Suit le fichier et réaffiche les tâches à chaque ajout (Ctrl+C pour quitter)"
+    )
+    parser_show.add_argument(
+        '--interval', 
+        type=positive_seconds,
+        default=1.0,
+        help="Délai en secondes entre deux vérifications avec --watch (défaut: 1.0)"
+    )
+    parser_show.add_argument(
+        '--events', 
+        action='store_true',
+        help="Avec --watch, émet un événement JSON par ligne au lieu du tableau"
+    )
     
     # === Commande ADD-LABEL ===
     parser_add_label = subparsers.add_parser(
@@ -160,4 +266,89 @@ def create_parser():
         help="Nouveaux labels (séparés par des virgules, ex: urgent,personnel)"
     )
     
+    # === Commande ARCHIVE ===
+    parser_archive = subparsers.add_parser(
+        'archive', 
+        help='Archiver des tâches',
+        description='Déplace les tâches sélectionnées vers le segment d\'archive (<fichier>.archive)'
+    )
+    parser_archive.add_argument(
+        '--where-label', 
+        dest='where_label',
+        help="N'archive que les tâches ayant ce label"
+    )
+    parser_archive.add_argument(
+        '--ids', 
+        help="Plage d'IDs à archiver (ex: 1-100, 50-, -20 ou 7)"
+    )
+    parser_archive.add_argument(
+        '--compress', 
+        action='store_true',
+        help="Compresse l'archive avec gzip lors de sa création"
+    )
+    
+    # === Commande STATS ===
+    parser_stats = subparsers.add_parser(
+        'stats', 
+        help='Afficher des statistiques sur les tâches',
+        description='Compte les tâches par label, les co-occurrences de labels, les tâches sans label, '
+                    'les IDs manquants et la distribution des longueurs de description'
+    )
+    parser_stats.add_argument(
+        '--json', 
+        action='store_true',
+        help="Affiche les statistiques au format JSON"
+    )
+    
+    # === Commande IMPORT ===
+    parser_import = subparsers.add_parser(
+        'import', 
+        help='Importer des tâches depuis un fichier CSV ou JSONL',
+        description='Ajoute en masse les tâches d\'un fichier CSV (colonnes description,labels) '
+                    'ou JSONL, avec de nouveaux IDs consécutifs'
+    )
+    parser_import.add_argument(
+        'source', 
+        help="Fichier à importer ('-' pour l'entrée standard)"
+    )
+    parser_import.add_argument(
+        '--format', 
+        choices=['csv', 'jsonl'],
+        help="Format du fichier (déduit de l'extension par défaut)"
+    )
+    
+    # === Commande EXPORT ===
+    parser_export = subparsers.add_parser(
+        'export', 
+        help='Exporter les tâches en CSV ou JSONL',
+        description='Écrit toutes les tâches dans un fichier CSV ou JSONL (ou sur la sortie standard)'
+    )
+    parser_export.add_argument(
+        'destination', 
+        nargs='?',
+        help="Fichier de sortie (sortie standard par défaut)"
+    )
+    parser_export.add_argument(
+        '--format', 
+        choices=['csv', 'jsonl'],
+        help="Format de sortie (déduit de l'extension, CSV par défaut sur la sortie standard)"
+    )
+    parser_export.add_argument(
+        '--all', 
+        action='store_true',
+        help="Exporte aussi les tâches archivées"
+    )
+    
+    # === Commande SYNC ===
+    parser_sync = subparsers.add_parser(
+        'sync', 
+        help='Synchroniser avec une autre copie du fichier',
+        description='Échange uniquement les tâches ajoutées, modifiées ou supprimées entre deux copies; '
+                    'en cas de conflit sur un ID, la modification la plus récente l\'emporte'
+    )
+    parser_sync.add_argument(
+        'replica', 
+        help="Chemin vers l'autre copie du fichier de tâches"
+    )
+    
     return parser
@@ -0,0 +1,141 @@
+"""
+Streaming module for constant-memory rewrites of task files.
+
+Ce module modifie un fichier de tâches sans le charger en mémoire: le fichier
+est lu ligne par ligne, seule la tâche ciblée est analysée et transformée, et
+le résultat est écrit par gros blocs dans un fichier temporaire du même
+répertoire, renommé atomiquement à la fin. Une interruption laisse donc soit
+l'ancien fichier, soit le nouveau, jamais un fichier à moitié écrit.
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import contextlib
+import os
+import tempfile
+
+import core
+
+# Taille des tampons de lecture et d'écriture
+BUFFER_SIZE = 1 << 20
+
+
+class Unchanged(Exception):
+    """Interrompt atomic_write sans remplacer le fichier cible."""
+
+
+def current_umask():
+    """
+    Retourne le masque de création de fichiers du processus.
+
+    Note:
+        os.umask ne permet que de remplacer le masque: il est donc remis
+        immédiatement à sa valeur d'origine.
+    """
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+@contextlib.contextmanager
+def atomic_write(filename):
+    """
+    Écrit un fichier via un fichier temporaire renommé atomiquement.
+
+    Args:
+        filename (str): Fichier à créer ou remplacer
+
+    Yields:
+        file: Fichier temporaire ouvert en écriture texte, avec un tampon de BUFFER_SIZE
+
+    Note:
+        - En cas d'exception (y compris Unchanged), le fichier temporaire est
+          supprimé et filename n'est pas modifié
+        - Les permissions d'un fichier existant sont conservées
+        - Un lien symbolique est suivi: c'est le fichier pointé qui est remplacé,
+          comme avec open(filename, 'w'), et le lien reste en place
+    """
+    filename = os.path.realpath(filename)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        with os.fdopen(fd, 'w', buffering=BUFFER_SIZE) as out:
+            yield out
+            out.flush()
+            os.fsync(out.fileno())
+        try:
+            mode = os.stat(filename).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~current_umask()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def rewrite(filename, task_id, transform, all_matches=False, changes=None):
+    """
+    Applique une transformation à une tâche en réécrivant le fichier en flux.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        task_id (str|int): ID de la tâche ciblée
+        transform (callable): Reçoit la tâche (id, description, labels) et retourne
+                              la tâche à écrire, ou None pour la supprimer
+        all_matches (bool, optional): Transforme toutes les lignes portant cet ID
+                                      (par défaut, seulement la première)
+        changes (dict, optional): Reçoit {id: tâche écrite ou None si supprimée}
+                                  pour chaque tâche transformée (voir sync.track)
+
+    Returns:
+        int: Nombre de tâches transformées (0 si l'ID est introuvable ou invalide)
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+
+    Note:
+        - Mémoire constante: seule la ligne courante est en mémoire
+        - Les autres lignes sont recopiées telles quelles, sans être analysées
+          (seul leur ID est lu pour les comparer à la cible)
+        - Si aucune tâche ne correspond, le fichier n'est pas réécrit
+
+    Example:
+        >>> rewrite("tasks.txt", "2", lambda task: None)
+        1
+    """
+    try:
+        task_id = int(task_id)
+    except ValueError:
+        return 0
+
+    matches = 0
+    try:
+        with open(filename, 'r', buffering=BUFFER_SIZE) as src, atomic_write(filename) as out:
+            for line in src:
+                if matches == 0 or all_matches:
+                    # Lecture de l'ID seul, même règle que core.parse_tasks
+                    separator = line.find(";")
+                    try:
+                        is_target = separator >= 0 and int(line[:separator]) == task_id
+                    except ValueError:
+                        is_target = False
+
+                    if is_target:
+                        task = next(core.iter_tasks([line]), None)
+                        if task is not None:
+                            matches += 1
+                            task = transform(task)
+                            if changes is not None:
+                                changes[task_id] = task
+                            if task is not None:
+                                tid, desc, labels = task
+                                out.write(f"{tid};{desc};{','.join(labels)}\n")
+                            continue
+
+                out.write(line if line.endswith("\n") else line + "\n")
+
+            if not matches:
+                raise Unchanged()
+    except Unchanged:
+        return 0
+    return matches
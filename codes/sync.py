@@ -0,0 +1,519 @@
+"""
+Sync module for delta synchronization between task-file replicas.
+
+Ce module synchronise deux copies d'un fichier de tâches en ne transférant que
+les tâches ajoutées, modifiées ou supprimées. Chaque copie possède un manifeste
+(<fichier>.manifest) qui associe à chaque ID l'empreinte de la tâche et la date
+de son dernier changement observé; les IDs supprimés y restent sous forme de
+« pierres tombales » pour que la suppression puisse être propagée.
+
+Le manifeste est mis à jour de façon incrémentale:
+    - Fichier inchangé (identité, taille, dates): aucune lecture
+    - Ajouts en fin de fichier (voir watch.is_rewritten): seules les nouvelles
+      lignes sont lues et hachées
+    - Fichier réécrit (y compris sur place à taille égale): relecture complète
+      en flux, seules les empreintes différentes prennent une nouvelle date
+    - Écriture par une commande de task.py: le manifeste est corrigé en flux
+      sans relire le fichier (voir track), sauf archive qui le laisse périmé
+
+Les tâches déplacées dans l'archive (commande archive) disparaissent du fichier
+sans être supprimées: leurs IDs sont retrouvés dans l'archive et mémorisés dans
+le manifeste, leurs entrées sont conservées et aucune suppression n'est propagée.
+
+Conflits: pour un même ID modifié des deux côtés, la version dont le
+changement est le plus récent l'emporte (last-writer-wins). Les dates sont
+celles de modification du fichier au moment où le changement est observé:
+les commandes qui écrivent un fichier synchronisé mettent son manifeste à jour
+(voir track), chaque changement garde donc sa propre date. Chaque manifeste
+mémorise aussi la date de sa dernière synchronisation avec chaque autre copie:
+un ID changé des deux côtés depuis (y compris un même ID ajouté séparément
+de chaque côté) est signalé comme conflit, car une des versions est perdue.
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import hashlib
+import json
+import locale
+import os
+import shutil
+import time
+
+import archive
+import core
+import fastparse
+import streaming
+import watch
+
+# Empreinte d'une tâche supprimée dans le manifeste
+TOMBSTONE = "-"
+
+
+def manifest_path(filename):
+    """
+    Retourne le chemin du manifeste associé à un fichier de tâches.
+
+    Example:
+        >>> manifest_path("lestaches.txt")
+        'lestaches.txt.manifest'
+    """
+    return filename + ".manifest"
+
+
+def record_hash(tid, desc, labels):
+    """
+    Calcule l'empreinte d'une tâche à partir de sa forme normalisée.
+
+    Returns:
+        str: Empreinte hexadécimale de 16 caractères (BLAKE2b, 8 octets)
+    """
+    line = f"{tid};{desc};{','.join(labels)}"
+    return hashlib.blake2b(line.encode(), digest_size=8).hexdigest()
+
+
+def load_manifest(filename):
+    """
+    Charge le manifeste d'un fichier de tâches.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+
+    Returns:
+        tuple: (state: dict, entries: dict)
+            - state: État de lecture du fichier (voir watch.new_state) avec
+              en plus 'archived', l'ensemble des IDs retrouvés dans l'archive,
+              et 'synced', {chemin réel d'une autre copie: date en ns de la
+              dernière synchronisation}
+            - entries: {id: (empreinte ou None si supprimée, date en ns)}
+        Un manifeste absent ou illisible donne un état vide.
+    """
+    try:
+        with open(manifest_path(filename), 'r') as f:
+            header = json.loads(f.readline())
+            state = {
+                'identity': tuple(header['identity']),
+                'offset': header['offset'],
+                'anchor': bytes.fromhex(header['anchor']),
+                'size': header['size'],
+                'mtime_ns': header['mtime_ns'],
+                'ctime_ns': header.get('ctime_ns'),
+                'archived': set(header.get('archived', ())),
+                'synced': dict(header.get('synced', {})),
+            }
+            entries = {}
+            for line in f:
+                tid, digest, stamp = line.rstrip("\n").split(";")
+                entries[int(tid)] = (None if digest == TOMBSTONE else digest, int(stamp))
+            return state, entries
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return dict(watch.new_state(), archived=set(), synced={}), {}
+
+
+def save_manifest(filename, state, entries):
+    """
+    Enregistre le manifeste d'un fichier de tâches (remplacement atomique).
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        state (dict): État de lecture retourné par file_state ou refresh
+        entries (dict): {id: (empreinte ou None, date en ns)}
+    """
+    header = {
+        'identity': list(state['identity']),
+        'offset': state['offset'],
+        'anchor': state['anchor'].hex(),
+        'size': state['size'],
+        'mtime_ns': state['mtime_ns'],
+        'ctime_ns': state['ctime_ns'],
+        'archived': sorted(state.get('archived', ())),
+        'synced': state.get('synced', {}),
+    }
+    with streaming.atomic_write(manifest_path(filename)) as f:
+        f.write(json.dumps(header) + "\n")
+        for tid, (digest, stamp) in entries.items():
+            f.write(f"{tid};{digest or TOMBSTONE};{stamp}\n")
+
+
+def file_state(f, offset):
+    """
+    Décrit l'état d'un fichier ouvert après lecture jusqu'à offset.
+
+    Args:
+        f (file): Fichier ouvert en mode binaire
+        offset (int): Position de fin de la dernière ligne complète lue
+
+    Returns:
+        dict: État avec 'identity', 'offset', 'anchor', 'size', 'mtime_ns' et 'ctime_ns'
+    """
+    st = os.fstat(f.fileno())
+    start = max(offset - watch.ANCHOR_SIZE, 0)
+    f.seek(start)
+    return {
+        'identity': (st.st_dev, st.st_ino),
+        'offset': offset,
+        'anchor': f.read(offset - start),
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'ctime_ns': st.st_ctime_ns,
+    }
+
+
+def refresh(filename):
+    """
+    Met à jour le manifeste d'un fichier de tâches et retourne ses entrées.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+
+    Returns:
+        dict: {id: (empreinte ou None si supprimée, date en ns)}
+
+    Note:
+        - Un fichier inexistant est une copie vide sans historique: son manifeste
+          est ignoré pour ne jamais propager la perte d'un fichier entier
+        - Les tâches nouvelles ou modifiées prennent la date de modification
+          du fichier; les tâches disparues deviennent des pierres tombales,
+          sauf celles retrouvées dans l'archive (l'archive n'est lue que si des
+          IDs disparus ne sont pas déjà connus comme archivés)
+    """
+    state, entries = load_manifest(filename)
+    try:
+        f = open(filename, 'rb')
+    except FileNotFoundError:
+        return {}
+
+    with f:
+        st = os.fstat(f.fileno())
+        if (state['identity'] == (st.st_dev, st.st_ino) and state['size'] == st.st_size
+                and (state['mtime_ns'], state['ctime_ns']) == (st.st_mtime_ns, st.st_ctime_ns)):
+            # Manifeste à jour: aucune lecture du fichier
+            return entries
+
+        stamp = st.st_mtime_ns
+        encoding = locale.getpreferredencoding(False)
+        rewritten = watch.is_rewritten(f, state)
+        offset = 0 if rewritten else state['offset']
+        seen = set()
+
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                # Ligne en cours d'écriture: elle sera lue à la prochaine mise à jour
+                break
+            offset += len(raw)
+            # Même décodage et découpage que readlines() en mode texte
+            for tid, desc, labels in core.iter_tasks(fastparse.decode(raw, encoding).split("\n")):
+                seen.add(tid)
+                digest = record_hash(tid, desc, labels)
+                if entries.get(tid, (None,))[0] != digest:
+                    entries[tid] = (digest, stamp)
+
+        # Un ID de nouveau présent dans le fichier n'est plus considéré comme archivé
+        archived = state['archived'] - seen
+
+        # Après une réécriture, les IDs absents ont été supprimés ou archivés
+        if rewritten:
+            gone = {tid for tid, (digest, _) in entries.items()
+                    if digest is not None and tid not in seen and tid not in archived}
+            if gone and min(gone) <= archive.read_max_id(filename):
+                archived.update(tid for tid, _, _ in core.iter_tasks(archive.iter_archive(filename))
+                                if tid in gone)
+            for tid in gone - archived:
+                entries[tid] = (None, stamp)
+
+        new_state = file_state(f, offset)
+        new_state['archived'] = archived
+        new_state['synced'] = state['synced']
+
+    save_manifest(filename, new_state, entries)
+    return entries
+
+
+def snapshot(filename):
+    """
+    Relève l'état d'un fichier de tâches avant une écriture (voir track).
+
+    Returns:
+        tuple: (identité, taille, mtime_ns, ctime_ns), ou None si le fichier n'existe pas
+    """
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino), st.st_size, st.st_mtime_ns, st.st_ctime_ns
+
+
+def track(filename, before, changes=None):
+    """
+    Reporte une écriture dans le manifeste d'un fichier déjà synchronisé.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        before (tuple): État du fichier avant l'écriture (voir snapshot)
+        changes (dict, optional): {id: tâche écrite ou None si supprimée} pour une
+                                  réécriture (voir streaming.rewrite); None pour
+                                  des lignes ajoutées en fin de fichier
+
+    Note:
+        - Sans effet si le fichier n'a jamais été synchronisé (pas de manifeste)
+        - Le manifeste n'est corrigé que s'il décrivait exactement le fichier
+          avant l'écriture: sinon il reste périmé et la prochaine synchronisation
+          relit le fichier (voir refresh)
+        - Mémoire constante: le manifeste est recopié en flux, seules les entrées
+          des IDs de changes sont remplacées; pour un ajout, seules les lignes
+          écrites après l'ancienne fin du fichier sont lues et hachées. Le temps
+          reste proportionnel au nombre d'entrées du manifeste
+        - Chaque changement prend ainsi sa propre date (celle de l'écriture)
+          plutôt que celle de la prochaine synchronisation
+    """
+    path = manifest_path(filename)
+    try:
+        src = open(path, 'r', buffering=streaming.BUFFER_SIZE)
+    except FileNotFoundError:
+        return
+
+    try:
+        with src, open(filename, 'rb') as f:
+            header = json.loads(src.readline())
+            described = (tuple(header['identity']), header['size'],
+                         header['mtime_ns'], header.get('ctime_ns'))
+            if described != before or header['offset'] != header['size']:
+                # Manifeste déjà périmé: refresh relira tout le fichier
+                return
+
+            # Les commandes n'écrivent que des lignes complètes
+            size = f.seek(0, 2)
+            f.seek(max(size - 1, 0))
+            if f.read(1) not in (b"", b"\n"):
+                return
+            stamp = os.fstat(f.fileno()).st_mtime_ns
+            new_state = file_state(f, size)
+            header.update(new_state, identity=list(new_state['identity']),
+                          anchor=new_state['anchor'].hex())
+
+            with streaming.atomic_write(path) as out:
+                out.write(json.dumps(header) + "\n")
+                if changes is None:
+                    # Ajouts: les entrées existantes sont inchangées
+                    shutil.copyfileobj(src, out, streaming.BUFFER_SIZE)
+                    encoding = locale.getpreferredencoding(False)
+                    f.seek(before[1])
+                    for raw in f:
+                        for tid, desc, labels in core.iter_tasks(fastparse.decode(raw, encoding).split("\n")):
+                            out.write(f"{tid};{record_hash(tid, desc, labels)};{stamp}\n")
+                else:
+                    for line in src:
+                        if int(line[:line.find(";")]) not in changes:
+                            out.write(line)
+                    for tid, task in changes.items():
+                        digest = record_hash(*task) if task is not None else TOMBSTONE
+                        out.write(f"{tid};{digest};{stamp}\n")
+    except (ValueError, KeyError, TypeError):
+        # Manifeste illisible: il est ignoré par load_manifest, comme absent
+        return
+
+
+def plan(entries_a, entries_b):
+    """
+    Détermine les changements à appliquer de chaque côté (last-writer-wins).
+
+    Args:
+        entries_a (dict): Entrées du manifeste de la copie A
+        entries_b (dict): Entrées du manifeste de la copie B
+
+    Returns:
+        tuple: (to_a: dict, to_b: dict) où chaque dict associe un ID à l'entrée
+               gagnante (empreinte ou None pour une suppression, date) à appliquer
+
+    Note:
+        À date égale, la copie A (source de la commande) l'emporte.
+
+    Example:
+        >>> plan({1: ("aa", 2)}, {1: ("bb", 1), 2: ("cc", 1)})
+        ({2: ('cc', 1)}, {1: ('aa', 2)})
+    """
+    to_a = {}
+    to_b = {}
+    for tid in entries_a.keys() | entries_b.keys():
+        entry_a = entries_a.get(tid)
+        entry_b = entries_b.get(tid)
+        if entry_a is not None and entry_b is not None and entry_a[0] == entry_b[0]:
+            continue
+        if entry_b is None or (entry_a is not None and entry_a[1] >= entry_b[1]):
+            # Une suppression n'a rien à propager vers une copie qui ignore l'ID
+            if entry_a[0] is not None or entry_b is not None:
+                to_b[tid] = entry_a
+        elif entry_b[0] is not None or entry_a is not None:
+            to_a[tid] = entry_b
+    return to_a, to_b
+
+
+def find_conflicts(entries_a, entries_b, since):
+    """
+    Retourne les IDs changés dans les deux copies depuis leur dernière synchronisation.
+
+    Args:
+        entries_a (dict): Entrées du manifeste de la copie A
+        entries_b (dict): Entrées du manifeste de la copie B
+        since (int): Date de la dernière synchronisation (voir last_sync), ou None
+                     si les deux copies n'ont jamais été synchronisées ensemble
+
+    Returns:
+        list: IDs triés présents (ou supprimés) des deux côtés avec des empreintes
+              différentes et des dates postérieures à since: plan n'en garde
+              qu'une version
+
+    Example:
+        >>> find_conflicts({1: ("aa", 5), 2: ("bb", 5)}, {1: ("cc", 6), 2: ("dd", 1)}, 3)
+        [1]
+    """
+    conflicts = []
+    for tid, (digest_a, stamp_a) in entries_a.items():
+        entry_b = entries_b.get(tid)
+        if entry_b is None or entry_b[0] == digest_a:
+            continue
+        if since is None or (stamp_a > since and entry_b[1] > since):
+            conflicts.append(tid)
+    return sorted(conflicts)
+
+
+def read_header(filename):
+    """
+    Lit seulement l'en-tête du manifeste d'un fichier de tâches.
+
+    Returns:
+        dict: En-tête JSON du manifeste, vide si le manifeste est absent ou illisible
+    """
+    try:
+        with open(manifest_path(filename), 'r') as f:
+            header = json.loads(f.readline())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return header if isinstance(header, dict) else {}
+
+
+def last_sync(filename, other):
+    """
+    Retourne la date de la dernière synchronisation entre deux copies.
+
+    Returns:
+        int: Date en ns enregistrée dans les deux manifestes (la plus ancienne des
+             deux), ou None si l'un d'eux ne la connaît pas
+    """
+    stamps = []
+    for path, peer in ((filename, other), (other, filename)):
+        synced = read_header(path).get('synced')
+        stamp = synced.get(os.path.realpath(peer)) if isinstance(synced, dict) else None
+        if not isinstance(stamp, int):
+            return None
+        stamps.append(stamp)
+    return min(stamps)
+
+
+def mark_synced(filename, other):
+    """
+    Enregistre dans les deux manifestes la date de synchronisation des deux copies.
+
+    Note:
+        Seul l'en-tête change: le reste du manifeste est recopié en flux.
+        Un manifeste absent ou illisible est ignoré.
+    """
+    stamp = time.time_ns()
+    for path, peer in ((filename, other), (other, filename)):
+        header = read_header(path)
+        if not header:
+            continue
+        synced = header.get('synced')
+        header['synced'] = dict(synced) if isinstance(synced, dict) else {}
+        header['synced'][os.path.realpath(peer)] = stamp
+        with open(manifest_path(path), 'r', buffering=streaming.BUFFER_SIZE) as src, \
+                streaming.atomic_write(manifest_path(path)) as out:
+            src.readline()
+            out.write(json.dumps(header) + "\n")
+            shutil.copyfileobj(src, out, streaming.BUFFER_SIZE)
+
+
+def apply(source, target, changes, target_entries, conflicts=()):
+    """
+    Applique à la copie cible les changements gagnants de la copie source.
+
+    Args:
+        source (str): Fichier de tâches source des tâches à copier
+        target (str): Fichier de tâches à mettre à jour
+        changes (dict): {id: entrée gagnante} retourné par plan
+        target_entries (dict): Entrées du manifeste de la cible, mises à jour sur place
+        conflicts (iterable, optional): IDs en conflit (voir find_conflicts)
+
+    Returns:
+        tuple: (added: int, updated: int, removed: int, resolved: int), où resolved
+               compte les IDs en conflit écrits ou supprimés dans la cible (ils ne
+               sont pas comptés dans les trois autres nombres)
+
+    Note:
+        - Seules les tâches à copier sont conservées en mémoire: la source et la
+          cible sont parcourues en flux
+        - La cible est réécrite dans un fichier temporaire puis renommée
+          atomiquement (streaming.atomic_write); son manifeste reprend les
+          dates gagnantes
+    """
+    # Récupère dans la source uniquement les tâches à transférer
+    needed = {tid for tid, (digest, _) in changes.items() if digest is not None}
+    records = {}
+    if needed:
+        with open(source, 'r') as f:
+            for task in core.iter_tasks(f):
+                if task[0] in needed:
+                    records[task[0]] = task
+
+    conflicts = set(conflicts)
+    added = updated = removed = resolved = 0
+    written = set()
+    with streaming.atomic_write(target) as out:
+        # Recopie la cible en remplaçant ou supprimant les tâches concernées
+        try:
+            with open(target, 'r', buffering=streaming.BUFFER_SIZE) as f:
+                for line in f:
+                    task = next(core.iter_tasks([line]), None)
+                    if task is None or task[0] not in changes:
+                        out.write(line if line.endswith("\n") else line + "\n")
+                    elif task[0] in written:
+                        # Doublon d'un ID déjà remplacé: la première occurrence suffit
+                        continue
+                    elif task[0] in records:
+                        tid, desc, labels = records[task[0]]
+                        out.write(f"{tid};{desc};{','.join(labels)}\n")
+                        written.add(tid)
+                        if tid in conflicts:
+                            resolved += 1
+                        else:
+                            updated += 1
+                    elif changes[task[0]][0] is None:
+                        if task[0] in conflicts:
+                            resolved += 1
+                        else:
+                            removed += 1
+                    else:
+                        # Tâche introuvable dans la source: la version cible est conservée
+                        out.write(line if line.endswith("\n") else line + "\n")
+        except FileNotFoundError:
+            pass
+
+        # Ajoute les tâches absentes de la cible
+        for tid, (_, desc, labels) in records.items():
+            if tid not in written:
+                out.write(f"{tid};{desc};{','.join(labels)}\n")
+                if tid in conflicts:
+                    resolved += 1
+                else:
+                    added += 1
+
+    # Le manifeste de la cible reprend les entrées gagnantes (les tâches copiées
+    # sont désormais dans le fichier, plus seulement dans l'archive)
+    target_entries.update(changes)
+    target_state, _ = load_manifest(target)
+    with open(target, 'rb') as f:
+        new_state = file_state(f, os.fstat(f.fileno()).st_size)
+    new_state['archived'] = target_state['archived'] - records.keys()
+    new_state['synced'] = target_state['synced']
+    save_manifest(target, new_state, target_entries)
+    return added, updated, removed, resolved
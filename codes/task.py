@@ -10,13 +10,22 @@ Usage:
     python3 task.py <fichier> add <description>
     python3 task.py <fichier> modify <id> <nouvelle_description>
     python3 task.py <fichier> rm <id>
-    python3 task.py <fichier> show
+    python3 task.py <fichier> show [--all] [--watch [--events]]
+    python3 task.py <fichier> show --sort id|description|labels [--desc] [--max-memory 64M]
+    python3 task.py <fichier> archive [--where-label <label>] [--ids <debut-fin>]
+    python3 task.py --files <motif> show [--filter <label>]
+    python3 task.py <fichier> stats [--json]
+    python3 task.py <fichier> import <source.csv|source.jsonl>
+    python3 task.py <fichier> export [destination.csv|destination.jsonl]
+    python3 task.py <fichier> sync <copie>
 
 Exemples:
     python3 task.py lestaches.txt add "Faire les courses"
     python3 task.py lestaches.txt modify 1 "Faire les courses au supermarché"
     python3 task.py lestaches.txt rm 1
     python3 task.py lestaches.txt show
+    python3 task.py lestaches.txt archive --where-label done
+    python3 task.py --files 'teams/*.txt' show --filter urgent
 
 Auteurs: Groupe 4 - Codecamp
 Date: Septembre 2025
@@ -25,64 +34,117 @@ Date: Septembre 2025
 import commands
 from options import create_parser
 
-# === ANALYSE DES ARGUMENTS ===
-# Création et utilisation du parseur de ligne de commande
-options = create_parser().parse_args()
 
-try:
-    # === LECTURE DU FICHIER DE TÂCHES ===
-    # Tente de lire le fichier existant
-    with open(options.file, 'r') as f:
-        tasks = f.readlines()
+def main():
+    """
+    Point d'entrée du programme: analyse les arguments et exécute la commande.
     
-    # === EXÉCUTION DE LA COMMANDE ===
-    # Dispatch vers la fonction appropriée selon la commande
-    if options.command == 'add':
-        # Parse les labels si fournis
-        labels = None
-        if hasattr(options, 'labels') and options.labels:
-            labels = [label.strip() for label in options.labels.split(",") if label.strip()]
-        # Ajoute une nouvelle tâche
-        commands.add(' '.join(options.details), options.file, tasks, labels)
-        
-    elif options.command == 'modify':
-        # Modifie une tâche existante
-        commands.modify(options.id, ' '.join(options.details), options.file, tasks)
-        
-    elif options.command == 'rm':
-        # Supprime une tâche
-        commands.rm(options.id, options.file, tasks)
-        
-    elif options.command == 'show':
-        # Affiche toutes les tâches avec filtre optionnel
-        label_filter = getattr(options, 'filter', None)
-        commands.show(tasks, label_filter)
-        
-    elif options.command == 'add-label':
-        # Ajoute un label à une tâche
-        commands.add_label(options.id, options.label, options.file, tasks)
-        
-    elif options.command == 'rm-label':
-        # Supprime un label d'une tâche
-        commands.rm_label(options.id, options.label, options.file, tasks)
-        
-    elif options.command == 'set-labels':
-        # Remplace les labels d'une tâche
-        commands.set_labels(options.id, options.labels, options.file, tasks)
-        
-except FileNotFoundError:
-    # === GESTION DES FICHIERS INEXISTANTS ===
-    # Gère le cas où le fichier de tâches n'existe pas encore
-    if options.command == 'add':
-        # Parse les labels si fournis
-        labels = None
-        if hasattr(options, 'labels') and options.labels:
-            labels = [label.strip() for label in options.labels.split(",") if label.strip()]
-        # Permet d'ajouter la première tâche dans un nouveau fichier
-        commands.add(' '.join(options.details), options.file, [], labels)
-    elif options.command in ['modify', 'rm', 'add-label', 'rm-label', 'set-labels']:
-        # Impossible de modifier dans un fichier inexistant
-        print(f"Error: The file {options.file} was not found")
-    elif options.command == 'show':
-        # Affiche un message approprié pour un fichier vide
-        print("No tasks found.")
+    Note:
+        Protégé par le test __name__ == '__main__': les processus de travail de
+        show --files importent ce module sans relancer la commande.
+    """
+    # === ANALYSE DES ARGUMENTS ===
+    # Création et utilisation du parseur de ligne de commande
+    parser = create_parser()
+    options = parser.parse_args()
+
+    # Un fichier de tâches est requis, sauf pour show avec --files
+    if options.files is None and options.file is None:
+        parser.error("the task file is required (or --files with show)")
+    if options.files is not None and (options.file is not None or options.command != 'show'
+                                      or options.watch or options.sort):
+        parser.error("--files only applies to the show command, without a task file, --watch or --sort")
+
+    # === REQUÊTE MULTI-FICHIERS ===
+    if options.files is not None:
+        commands.show_files(options.files, options.filter, options.all)
+        return
+
+    try:
+        # === EXÉCUTION DE LA COMMANDE ===
+        # Dispatch vers la fonction appropriée selon la commande
+        if options.command == 'add':
+            # Parse les labels si fournis
+            labels = None
+            if hasattr(options, 'labels') and options.labels:
+                labels = [label.strip() for label in options.labels.split(",") if label.strip()]
+            # Ajoute une nouvelle tâche
+            commands.add(' '.join(options.details), options.file, labels)
+            
+        elif options.command == 'modify':
+            # Modifie une tâche existante
+            commands.modify(options.id, ' '.join(options.details), options.file)
+            
+        elif options.command == 'rm':
+            # Supprime une tâche
+            commands.rm(options.id, options.file)
+            
+        elif options.command == 'show':
+            # Affiche toutes les tâches avec filtre optionnel
+            label_filter = getattr(options, 'filter', None)
+            if options.watch:
+                # Suivi continu: le module watch relit lui-même le fichier
+                commands.show_watch(options.file, label_filter, options.interval, options.events,
+                                    options.all)
+            elif options.sort:
+                # Tri externe sous budget mémoire
+                commands.show_sorted(options.file, options.sort, options.desc, options.max_memory,
+                                     label_filter, options.all)
+            else:
+                commands.show(options.file, label_filter, options.all)
+            
+        elif options.command == 'add-label':
+            # Ajoute un label à une tâche
+            commands.add_label(options.id, options.label, options.file)
+            
+        elif options.command == 'rm-label':
+            # Supprime un label d'une tâche
+            commands.rm_label(options.id, options.label, options.file)
+            
+        elif options.command == 'set-labels':
+            # Remplace les labels d'une tâche
+            commands.set_labels(options.id, options.labels, options.file)
+            
+        elif options.command == 'archive':
+            # Déplace des tâches vers le segment d'archive
+            commands.archive_tasks(options.file, options.where_label,
+                                   options.ids, options.compress)
+            
+        elif options.command == 'stats':
+            # Statistiques en un seul passage sur le fichier
+            commands.stats(options.file, options.json)
+            
+        elif options.command == 'import':
+            # Import en masse depuis un fichier CSV/JSONL
+            commands.import_tasks(options.file, options.source, options.format)
+            
+        elif options.command == 'export':
+            # Export en flux vers un fichier CSV/JSONL
+            commands.export_tasks(options.file, options.destination, options.format, options.all)
+            
+        elif options.command == 'sync':
+            # Synchronisation différentielle entre deux copies
+            commands.sync_files(options.file, options.replica)
+            
+    except FileNotFoundError:
+        # === GESTION DES FICHIERS INEXISTANTS ===
+        # Gère le cas où le fichier de tâches n'existe pas encore
+        # (add et show sans option gèrent eux-mêmes un fichier absent: l'erreur ne
+        # peut venir que d'un répertoire inexistant)
+        if options.command in ['add', 'modify', 'rm', 'add-label', 'rm-label', 'set-labels', 'archive',
+                               'stats', 'import', 'export', 'sync']:
+            # Impossible de modifier dans un fichier inexistant
+            print(f"Error: The file {options.file} was not found")
+        elif options.command == 'show':
+            label_filter = getattr(options, 'filter', None)
+            if options.watch:
+                # Attend la création du fichier
+                commands.show_watch(options.file, label_filter, options.interval, options.events,
+                                    options.all)
+            else:
+                # show --sort: fichier vide, seule l'archive peut encore contenir des tâches
+                commands.show(options.file, label_filter, options.all)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Differential tests for the fast parser.
+
+Compare fastparse.parse et fastparse.parse_ids avec l'analyseur de référence
+core.parse_tasks(f.readlines()) sur des fichiers générés aléatoirement: lignes
+canoniques et ancien format, lignes vides, séparateurs en trop, fins de ligne
+CRLF/CR, espaces Unicode, chiffres non ASCII, IDs invalides...
+
+Les graines sont fixes: un échec est reproductible. Lancement:
+    python3 codes/test_fastparse.py
+    python3 -m pytest codes/test_fastparse.py
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import core
+import fastparse
+
+# Nombre de fichiers générés par test
+ITERATIONS = 3000
+
+# Caractères des lignes quelconques (séparateurs, espaces Unicode, chiffres arabes...)
+NOISE = ['1', '2', '0', '9', ';', ';', ';', ',', ',', ' ', '\t', '\r', '\n', '\r\n',
+         '\xa0', 'é', 'a', 'z', '+', '-', '_', '\x1c', '\x0b', '\x0c', '\x85',
+         ' ', '　', '٣']
+
+# IDs acceptés ou non par int() selon les mêmes règles que core.parse_tasks
+IDS = [' 7', '+3', '٣', '1_0', '0x1', '', ' ', '\xa05', '-2', '007']
+
+
+def random_line(rng):
+    """
+    Génère une ligne de fichier de tâches, valide ou non.
+    """
+    if rng.random() < 0.4:
+        return ''.join(rng.choice(NOISE) for _ in range(rng.randint(0, 12)))
+
+    tid = str(rng.randint(0, 999)) if rng.random() < 0.7 else rng.choice(IDS)
+    description = ''.join(rng.choice(['a', 'b', ' ', 'é', '\xa0', ',', '\t'])
+                          for _ in range(rng.randint(0, 6)))
+    labels = ','.join(''.join(rng.choice(['u', 'v', ' ', 'é', '\xa0'])
+                              for _ in range(rng.randint(0, 3)))
+                      for _ in range(rng.randint(0, 3)))
+    parts = [tid, description]
+    if rng.random() < 0.8:
+        parts.append(labels)
+    if rng.random() < 0.1:
+        parts.append(labels)
+    line = ';'.join(parts)
+    if rng.random() < 0.2:
+        line = rng.choice([' ', '\t', '\xa0', '\x1c']) + line
+    if rng.random() < 0.2:
+        line += rng.choice([' ', '\t', '\xa0', '\x1c', '　'])
+    return line
+
+
+def canonical_line(rng):
+    """
+    Génère une ligne "ID;Description;Labels" comme celles écrites par les commandes.
+    """
+    description = ''.join(rng.choice('ab é,') for _ in range(rng.randint(0, 5)))
+    labels = rng.choice(['', 'u', 'u,v', ' u , v', 'é', 'u\xa0', ',,'])
+    return f"{rng.randint(1, 99)};{description};{labels}" + rng.choice(['', ';x', ' ', '\xa0'])
+
+
+class FastParseDifferentialTest(unittest.TestCase):
+    """Vérifie que fastparse donne exactement le résultat de core.parse_tasks."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tasks.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def check(self, text):
+        # Le fichier est relu en mode texte comme le fait task.py
+        data = text.encode('utf-8')
+        with open(self.path, 'wb') as f:
+            f.write(data)
+        with open(self.path, 'r', encoding='utf-8') as f:
+            expected = core.parse_tasks(f.readlines())
+
+        self.assertEqual(fastparse.parse(data, 'utf-8'), expected, repr(text))
+        self.assertEqual(fastparse.parse_ids(data, 'utf-8'), [task[0] for task in expected],
+                         repr(text))
+        self.assertEqual(fastparse.max_id(data, 'utf-8'),
+                         max((task[0] for task in expected), default=0), repr(text))
+
+    def test_random_files(self):
+        rng = random.Random(34)
+        for _ in range(ITERATIONS):
+            newline = rng.choice(['\n', '\r\n', '\r'])
+            text = newline.join(random_line(rng) for _ in range(rng.randint(0, 8)))
+            if rng.random() < 0.5:
+                text += newline
+            self.check(text)
+
+    def test_canonical_files(self):
+        # Fichiers écrits par les commandes: chemin rapide par découpage en colonnes
+        rng = random.Random(340)
+        for _ in range(ITERATIONS):
+            text = '\n'.join(canonical_line(rng) for _ in range(rng.randint(0, 6)))
+            self.check(text + rng.choice(['', '\n', '\n\n  \n']))
+
+    def test_labels_are_not_shared(self):
+        # Chaque tâche doit recevoir sa propre liste de labels
+        parsed_tasks = fastparse.parse(b"1;a;x,y\n2;b;x,y\n", 'utf-8')
+        parsed_tasks[0][2].append("z")
+        self.assertEqual(parsed_tasks[1][2], ['x', 'y'])
+
+    def test_parse_file(self):
+        self.check("1;Faire les courses;urgent,personnel\n2;Reviser\n")
+        self.assertEqual(fastparse.parse_file(self.path, 'utf-8'),
+                         [(1, 'Faire les courses', ['urgent', 'personnel']), (2, 'Reviser', [])])
+
+
+if __name__ == '__main__':
+    unittest.main()
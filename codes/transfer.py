@@ -0,0 +1,147 @@
+"""
+Transfer module for bulk import/export of tasks.
+
+Ce module lit et écrit des tâches dans des formats d'échange (CSV et JSONL),
+enregistrement par enregistrement, afin que l'import et l'export d'un grand
+nombre de tâches se fassent en mémoire bornée.
+
+Formats supportés:
+    - csv   : en-tête obligatoire avec une colonne "description" et une colonne
+              "labels" optionnelle (labels séparés par des virgules dans le champ)
+    - jsonl : un objet JSON par ligne, {"description": "...", "labels": [...]}
+              ("labels" peut aussi être une chaîne "label1,label2")
+La colonne/clé "id" éventuelle est ignorée à l'import: les IDs sont réattribués.
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import csv
+import json
+import os
+
+FORMATS = ('csv', 'jsonl')
+
+
+def guess_format(path, fmt=None):
+    """
+    Détermine le format d'échange d'un fichier.
+
+    Args:
+        path (str|None): Chemin du fichier (None pour l'entrée/sortie standard)
+        fmt (str, optional): Format imposé par l'utilisateur
+
+    Returns:
+        str: 'csv' ou 'jsonl'
+
+    Raises:
+        ValueError: Si le format ne peut pas être déterminé
+
+    Example:
+        >>> guess_format("export.jsonl")
+        'jsonl'
+    """
+    if fmt:
+        return fmt
+    extension = os.path.splitext(path or "")[1].lower().lstrip(".")
+    if extension in FORMATS:
+        return extension
+    if extension in ('json', 'ndjson'):
+        return 'jsonl'
+    raise ValueError(f"cannot guess format of '{path or '-'}', use --format csv|jsonl")
+
+
+def read_records(f, fmt):
+    """
+    Parcourt paresseusement les enregistrements bruts d'un fichier d'échange.
+
+    Args:
+        f (file): Fichier ouvert en lecture (mode texte, newline='' pour le CSV)
+        fmt (str): 'csv' ou 'jsonl'
+
+    Yields:
+        tuple: (line_no: int, raw) où raw est un dict (CSV) ou une ligne (JSONL),
+               à convertir avec parse_record
+
+    Raises:
+        ValueError: Si l'en-tête CSV ne contient pas de colonne "description",
+                    si le CSV est illisible (octet nul, champ trop long...) ou
+                    si le contenu ne peut pas être décodé
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(f)
+        try:
+            if reader.fieldnames is None:
+                return
+            if 'description' not in reader.fieldnames:
+                raise ValueError("CSV header must contain a 'description' column")
+            for row in reader:
+                yield reader.line_num, row
+        except csv.Error as e:
+            raise ValueError(f"line {reader.line_num}: {e}") from e
+    else:
+        for line_no, line in enumerate(f, 1):
+            if line.strip():
+                yield line_no, line
+
+
+def parse_record(raw, fmt):
+    """
+    Convertit un enregistrement brut en description et liste de labels.
+
+    Args:
+        raw (dict|str): Enregistrement produit par read_records
+        fmt (str): 'csv' ou 'jsonl'
+
+    Returns:
+        tuple: (description: str, labels: list)
+
+    Raises:
+        ValueError: Si l'enregistrement est mal formé (JSON invalide, champ manquant...)
+
+    Example:
+        >>> parse_record('{"description": "Courses", "labels": "urgent, perso"}', 'jsonl')
+        ('Courses', ['urgent', 'perso'])
+    """
+    if fmt == 'jsonl':
+        raw = json.loads(raw)
+        if not isinstance(raw, dict):
+            raise ValueError("record is not a JSON object")
+
+    description = raw.get('description')
+    if not isinstance(description, str):
+        raise ValueError("missing or invalid 'description'")
+
+    labels = raw.get('labels') or []
+    if isinstance(labels, str):
+        labels = labels.split(",")
+    elif not isinstance(labels, list) or not all(isinstance(label, str) for label in labels):
+        raise ValueError("'labels' must be a string or a list of strings")
+
+    return description, [label.strip() for label in labels if label.strip()]
+
+
+def write_records(f, fmt, parsed_tasks):
+    """
+    Écrit des tâches dans un fichier d'échange, une par une.
+
+    Args:
+        f (file): Fichier ouvert en écriture (newline='' pour le CSV)
+        fmt (str): 'csv' ou 'jsonl'
+        parsed_tasks (iterable): Tuples (id, description, labels), consommés en flux
+
+    Returns:
+        int: Nombre de tâches écrites
+    """
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(['id', 'description', 'labels'])
+        for tid, desc, labels in parsed_tasks:
+            writer.writerow([tid, desc, ",".join(labels)])
+            count += 1
+    else:
+        for tid, desc, labels in parsed_tasks:
+            f.write(json.dumps({"id": tid, "description": desc, "labels": labels},
+                               ensure_ascii=False) + "\n")
+            count += 1
+    return count
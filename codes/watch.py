@@ -0,0 +1,124 @@
+"""
+Watch module for incremental reading of task files.
+
+Ce module permet de suivre un fichier de tâches sans le relire entièrement à
+chaque rafraîchissement. Il mémorise l'identité du fichier (périphérique,
+inode), sa taille et ses dates de modification, la position en octets déjà lue
+et les derniers octets lus (« ancre »), puis ne lit que les lignes ajoutées
+depuis le dernier passage.
+
+Détection d'une réécriture (modify, rm, archive, édition externe...):
+    - L'identité du fichier a changé (remplacement par renommage)
+    - La taille du fichier est inférieure à la position déjà lue
+    - La taille est inchangée mais le fichier a été modifié (mtime ou ctime):
+      un ajout fait forcément grandir le fichier, il s'agit donc d'une
+      réécriture sur place de même longueur
+    - Le fichier a grandi mais l'ancre ne se retrouve plus à la même position
+      (réécriture sur place qui allonge le fichier)
+Dans ces cas, le fichier est relu depuis le début.
+
+Auteurs: Groupe 4 - Codecamp
+"""
+
+import os
+
+import fastparse
+
+# Nombre d'octets mémorisés pour vérifier que le début du fichier n'a pas changé
+ANCHOR_SIZE = 64
+
+
+def new_state():
+    """
+    Crée l'état de suivi initial d'un fichier (rien n'a encore été lu).
+
+    Returns:
+        dict: État avec les clés 'identity', 'offset', 'anchor', 'size',
+              'mtime_ns' et 'ctime_ns'
+    """
+    return {'identity': None, 'offset': 0, 'anchor': b'',
+            'size': None, 'mtime_ns': None, 'ctime_ns': None}
+
+
+def is_rewritten(f, state):
+    """
+    Indique si un fichier a été réécrit depuis la lecture décrite par state.
+
+    Args:
+        f (file): Fichier ouvert en mode binaire
+        state (dict): État de suivi (voir new_state)
+
+    Returns:
+        bool: True si le fichier doit être relu depuis le début, False si seules
+              des données ont pu être ajoutées après state['offset']
+    """
+    st = os.fstat(f.fileno())
+    if (st.st_dev, st.st_ino) != state['identity'] or st.st_size < state['offset']:
+        return True
+
+    # Même taille mais fichier modifié: réécriture sur place de même longueur
+    if (st.st_size == state.get('size')
+            and (st.st_mtime_ns, st.st_ctime_ns) != (state.get('mtime_ns'), state.get('ctime_ns'))):
+        return True
+
+    # Vérifie que les derniers octets lus sont toujours en place
+    anchor = state['anchor']
+    if anchor:
+        f.seek(state['offset'] - len(anchor))
+        return f.read(len(anchor)) != anchor
+    return False
+
+
+def poll(filename, state):
+    """
+    Lit les lignes complètes ajoutées au fichier depuis le dernier appel.
+
+    Args:
+        filename (str): Chemin vers le fichier de tâches
+        state (dict): État de suivi créé par new_state, mis à jour sur place
+
+    Returns:
+        tuple: (reloaded: bool, lines: list)
+            - reloaded: True si le fichier a été réécrit et relu depuis le début
+            - lines: Nouvelles lignes complètes (toutes les lignes si reloaded)
+
+    Note:
+        - Une ligne sans saut de ligne final (écriture en cours) n'est pas
+          consommée: elle sera lue au prochain appel une fois terminée
+        - Un fichier supprimé est considéré comme réécrit et vide
+        - Les lignes sont décodées et découpées comme par readlines() en mode
+          texte (encodage de open(), fins de ligne "\\r\\n" et "\\r")
+    """
+    try:
+        f = open(filename, 'rb')
+    except FileNotFoundError:
+        reloaded = state['identity'] is not None
+        state.update(new_state())
+        return reloaded, []
+
+    with f:
+        st = os.fstat(f.fileno())
+        identity = (st.st_dev, st.st_ino)
+        anchor = state['anchor']
+        reloaded = is_rewritten(f, state)
+
+        offset = 0 if reloaded else state['offset']
+        if reloaded:
+            anchor = b''
+        f.seek(offset)
+        data = f.read()
+
+    # Ne consomme que les lignes terminées
+    end = data.rfind(b"\n") + 1
+    chunk = data[:end]
+    if chunk:
+        anchor = (anchor + chunk)[-ANCHOR_SIZE:]
+
+    state['identity'] = identity
+    state['offset'] = offset + end
+    state['anchor'] = anchor
+    state['size'] = st.st_size
+    state['mtime_ns'] = st.st_mtime_ns
+    state['ctime_ns'] = st.st_ctime_ns
+    # Le morceau se termine par "\n": le dernier élément du découpage est vide
+    return reloaded, fastparse.decode(chunk).split("\n")[:-1]